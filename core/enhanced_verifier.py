@@ -16,6 +16,26 @@ from dataclasses import dataclass
 from enum import Enum
 import hashlib
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# 登录后跳转路径的成功/失败标志
+_SUCCESS_PATH_RE = re.compile(
+    r'dashboard|home|index|main|admin|welcome|user|center|portal|workspace|console'
+)
+_FAILURE_PATH_RE = re.compile(r'login|signin|auth|error|fail')
+
+
+def _loads_json(content: bytes) -> Any:
+    """解析JSON响应体，优先使用orjson"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
 
 class LoginStatus(Enum):
     """登录状态枚举"""
@@ -46,27 +66,27 @@ class EnhancedLoginVerifier:
     """增强版登录验证器"""
     
     # 常见用户名字段
-    USERNAME_FIELDS = [
+    USERNAME_FIELDS = (
         'username', 'user', 'login', 'email', 'account', 'uin', 'id', 'name',
         'userName', 'loginName', 'userid', 'user_name', 'login_name', 'uid',
         'mobile', 'phone', 'tel', 'loginId', 'userCode', 'usercode'
-    ]
+    )
     
     # 常见密码字段
-    PASSWORD_FIELDS = [
+    PASSWORD_FIELDS = (
         'password', 'pwd', 'pass', 'passwd', 'secret', 'key',
         'passWord', 'login_password', 'user_pwd', 'loginPwd', 'userPwd'
-    ]
+    )
     
     # 常见验证码字段
-    CAPTCHA_FIELDS = [
+    CAPTCHA_FIELDS = (
         'captcha', 'code', 'verify', 'authcode', 'vcode', 'checkcode',
         'verifyCode', 'captchaCode', 'imgCode', 'validateCode', 'yzm',
         'randCode', 'captchaInput'
-    ]
+    )
     
     # 登录成功标志 - 扩展版
-    SUCCESS_INDICATORS = [
+    SUCCESS_INDICATORS = (
         # 关键词
         '欢迎', 'welcome', 'dashboard', 'logout', '退出', '主页', 'home',
         'profile', '设置', 'settings', 'admin', '用户中心', '成功',
@@ -80,10 +100,10 @@ class EnhancedLoginVerifier:
         # 特定系统成功标志
         '"resultCode":"0"', '"errCode":0', '"error":0',
         'token', 'access_token', 'session', 'jsessionid'
-    ]
+    )
     
     # 登录失败标志 - 扩展版
-    FAILURE_INDICATORS = [
+    FAILURE_INDICATORS = (
         '错误', 'error', '失败', 'failed', 'invalid', 'incorrect', 'wrong',
         '不正确', '不存在', '重新输入', '密码错误', '不匹配',
         '用户名或密码', '账号或密码', 'username or password',
@@ -92,13 +112,17 @@ class EnhancedLoginVerifier:
         '"success": false', '"code": -1', '"code": 1',
         '验证码错误', '验证码失效', '验证码过期',
         'unauthorized', 'forbidden', '禁止访问', '无权限'
-    ]
+    )
     
     # 需要验证码标志
-    CAPTCHA_REQUIRED_INDICATORS = [
+    CAPTCHA_REQUIRED_INDICATORS = (
         '请输入验证码', '验证码', 'captcha', '请填写验证码',
         '图形验证码', '滑动验证', '点击验证'
-    ]
+    )
+    
+    # 字段名集合，用于快速判断表单中是否存在候选字段
+    _USERNAME_FIELD_SET = frozenset(USERNAME_FIELDS)
+    _CAPTCHA_FIELD_SET = frozenset(CAPTCHA_FIELDS)
     
     def __init__(self, timeout: int = 30, verify_ssl: bool = False, max_retries: int = 3):
         """初始化验证器"""
@@ -108,6 +132,21 @@ class EnhancedLoginVerifier:
         self.session = requests.Session()
         self._setup_session()
     
+    def _scan_indicators(self, content: str) -> Dict[str, List[str]]:
+        """
+        扫描响应中出现的标志
+        
+        Returns:
+            {'captcha': [...], 'success': [...], 'failure': [...]}，各列表保持标志定义顺序
+        """
+        # 标志仅数十个，子串查找相对网络往返可忽略，不值得引入hyperscan等原生匹配器
+        content_lower = content.lower()
+        return {
+            'captcha': [i for i in self.CAPTCHA_REQUIRED_INDICATORS if i.lower() in content_lower],
+            'success': [i for i in self.SUCCESS_INDICATORS if i.lower() in content_lower],
+            'failure': [i for i in self.FAILURE_INDICATORS if i.lower() in content_lower],
+        }
+    
     def _setup_session(self):
         """设置会话"""
         self.session.headers.update({
@@ -137,7 +176,10 @@ class EnhancedLoginVerifier:
         Returns:
             目标类型: 'api', 'form', 'json_api', 'unknown'
         """
-        parsed = urlparse(url)
+        return self._detect_target_type(urlparse(url))
+    
+    def _detect_target_type(self, parsed) -> str:
+        """根据已解析的URL检测目标类型"""
         path = parsed.path.lower()
         
         # httpbin测试API
@@ -177,11 +219,11 @@ class EnhancedLoginVerifier:
         Returns:
             LoginResult
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         url = self.normalize_url(url)
         
         try:
-            target_type = self.detect_target_type(url)
+            target_type = self._detect_target_type(urlparse(url))
             
             # 特殊处理 CRM 系统
             if 'crmzzapp' in url.lower():
@@ -198,7 +240,7 @@ class EnhancedLoginVerifier:
                 status=LoginStatus.CONNECTION_ERROR,
                 success=False,
                 message="请求超时",
-                response_time=time.time() - start_time,
+                response_time=time.perf_counter() - start_time,
                 url=url,
                 final_url=url,
                 page_changed=False
@@ -208,7 +250,7 @@ class EnhancedLoginVerifier:
                 status=LoginStatus.CONNECTION_ERROR,
                 success=False,
                 message=f"连接失败: {str(e)[:50]}",
-                response_time=time.time() - start_time,
+                response_time=time.perf_counter() - start_time,
                 url=url,
                 final_url=url,
                 page_changed=False
@@ -218,7 +260,7 @@ class EnhancedLoginVerifier:
                 status=LoginStatus.UNKNOWN_ERROR,
                 success=False,
                 message=f"验证错误: {str(e)[:100]}",
-                response_time=time.time() - start_time,
+                response_time=time.perf_counter() - start_time,
                 url=url,
                 final_url=url,
                 page_changed=False
@@ -254,11 +296,11 @@ class EnhancedLoginVerifier:
                     verify=False
                 )
                 
-                response_time = time.time() - start_time
+                response_time = time.perf_counter() - start_time
                 
                 # 检查响应
                 try:
-                    data = response.json()
+                    data = _loads_json(response.content)
                     
                     # 检查成功 - 直接返回 true
                     if data is True or data == 'true':
@@ -325,7 +367,7 @@ class EnhancedLoginVerifier:
             status=LoginStatus.PASSWORD_ERROR,
             success=False,
             message="登录失败",
-            response_time=time.time() - start_time,
+            response_time=time.perf_counter() - start_time,
             url=base_url,
             final_url=base_url,
             page_changed=False
@@ -348,11 +390,11 @@ class EnhancedLoginVerifier:
             verify=self.verify_ssl
         )
         
-        response_time = time.time() - start_time
+        response_time = time.perf_counter() - start_time
         
         # httpbin会回显数据，检查是否包含我们发送的数据
         try:
-            json_response = response.json()
+            json_response = _loads_json(response.content)
             form_data = json_response.get('form', {})
             
             # 如果回显了我们的用户名和密码，视为"成功"（测试目的）
@@ -434,7 +476,7 @@ class EnhancedLoginVerifier:
     
     def _analyze_json_response(self, response, url: str, start_time: float) -> LoginResult:
         """分析JSON响应"""
-        response_time = time.time() - start_time
+        response_time = time.perf_counter() - start_time
         content = response.text.lower()
         
         # 检查成功标志
@@ -496,15 +538,19 @@ class EnhancedLoginVerifier:
                 status=LoginStatus.CONNECTION_ERROR,
                 success=False,
                 message=f"无法获取登录页面: {str(e)[:50]}",
-                response_time=time.time() - start_time,
+                response_time=time.perf_counter() - start_time,
                 url=url,
                 final_url=url,
                 page_changed=False
             )
         
-        # 解析表单
-        soup = BeautifulSoup(pre_content, 'html.parser')
-        form_info = self._extract_form_info(soup, url)
+        # 解析表单（JSON响应无需HTML解析，直接使用通用字段名）
+        content_type = page_response.headers.get('Content-Type', '').lower()
+        if 'json' in content_type:
+            form_info = None
+        else:
+            soup = BeautifulSoup(pre_content, 'html.parser')
+            form_info = self._extract_form_info(soup, url)
         
         # 构建登录数据
         login_data = {}
@@ -585,13 +631,15 @@ class EnhancedLoginVerifier:
             elif not action:
                 action = base_url
             
-            # 查找用户名字段
+            input_names = {inp.get('name') for inp in form.find_all('input') if inp.get('name')}
+            
+            # 查找用户名字段（按优先级顺序）
             username_field = None
-            for field_name in self.USERNAME_FIELDS:
-                inp = form.find('input', {'name': field_name})
-                if inp:
-                    username_field = field_name
-                    break
+            if not self._USERNAME_FIELD_SET.isdisjoint(input_names):
+                for field_name in self.USERNAME_FIELDS:
+                    if field_name in input_names:
+                        username_field = field_name
+                        break
             
             # 如果没找到，尝试查找text类型的input
             if not username_field:
@@ -606,11 +654,11 @@ class EnhancedLoginVerifier:
             
             # 查找验证码字段
             captcha_field = None
-            for field_name in self.CAPTCHA_FIELDS:
-                inp = form.find('input', {'name': field_name})
-                if inp:
-                    captcha_field = field_name
-                    break
+            if not self._CAPTCHA_FIELD_SET.isdisjoint(input_names):
+                for field_name in self.CAPTCHA_FIELDS:
+                    if field_name in input_names:
+                        captcha_field = field_name
+                        break
             
             # 获取隐藏字段
             hidden_fields = {}
@@ -639,56 +687,43 @@ class EnhancedLoginVerifier:
         start_time: float
     ) -> LoginResult:
         """分析登录响应"""
-        response_time = time.time() - start_time
+        response_time = time.perf_counter() - start_time
         content = response.text
-        content_lower = content.lower()
         
         # 计算页面变化
         page_changed = self._content_changed(pre_content, content)
         url_changed = pre_url != response.url
         
+        matched = self._scan_indicators(content)
+        
         # 1. 检查是否需要验证码
-        for indicator in self.CAPTCHA_REQUIRED_INDICATORS:
-            if indicator.lower() in content_lower:
-                # 检查是否在登录后的页面（非初始登录页）
-                if page_changed or url_changed:
-                    continue  # 可能是成功后的页面也有验证码相关文字
-                return LoginResult(
-                    status=LoginStatus.CAPTCHA_REQUIRED,
-                    success=False,
-                    message="需要验证码",
-                    response_time=response_time,
-                    url=original_url,
-                    final_url=response.url,
-                    page_changed=page_changed
-                )
+        # 登录后的页面（非初始登录页）也可能有验证码相关文字，此时不作判断
+        if matched['captcha'] and not (page_changed or url_changed):
+            return LoginResult(
+                status=LoginStatus.CAPTCHA_REQUIRED,
+                success=False,
+                message="需要验证码",
+                response_time=response_time,
+                url=original_url,
+                final_url=response.url,
+                page_changed=page_changed
+            )
         
         # 2. 检查成功标志
-        success_score = 0
-        matched_success = []
-        for indicator in self.SUCCESS_INDICATORS:
-            if indicator.lower() in content_lower:
-                success_score += 1
-                matched_success.append(indicator)
+        matched_success = matched['success']
+        success_score = len(matched_success)
         
         # 3. 检查失败标志
-        failure_score = 0
-        matched_failure = []
-        for indicator in self.FAILURE_INDICATORS:
-            if indicator.lower() in content_lower:
-                failure_score += 1
-                matched_failure.append(indicator)
+        matched_failure = matched['failure']
+        failure_score = len(matched_failure)
         
         # 4. 检查URL变化（跳转到新页面通常表示成功）
         if url_changed:
             final_path = urlparse(response.url).path.lower()
-            success_paths = ['dashboard', 'home', 'index', 'main', 'admin', 'welcome', 
-                           'user', 'center', 'portal', 'workspace', 'console']
-            failure_paths = ['login', 'signin', 'auth', 'error', 'fail']
             
-            if any(p in final_path for p in success_paths):
+            if _SUCCESS_PATH_RE.search(final_path):
                 success_score += 3
-            elif any(p in final_path for p in failure_paths):
+            elif _FAILURE_PATH_RE.search(final_path):
                 failure_score += 2
         
         # 5. 综合判断
@@ -755,6 +790,9 @@ class EnhancedLoginVerifier:
     
     def _content_changed(self, content1: str, content2: str) -> bool:
         """检查内容是否发生实质性变化"""
+        if content1 is content2:
+            return False
+        
         # 移除可能的动态内容
         def clean(text):
             text = re.sub(r'\d{10,}', '', text)  # 时间戳
@@ -776,6 +814,11 @@ class EnhancedLoginVerifier:
         if len_diff > 0.1:
             return True
         
+        # 长度相同时先比较首尾再整体比较，内容一致则无需计算hash
+        if (len(c1) == len(c2) and c1[:64] == c2[:64]
+                and c1[-64:] == c2[-64:] and c1 == c2):
+            return False
+        
         # 计算hash差异
         h1 = hashlib.md5(c1.encode()).hexdigest()
         h2 = hashlib.md5(c2.encode()).hexdigest()
@@ -5,16 +5,117 @@
 提供单URL登录验证功能，支持自动识别验证码和页面变化检测
 """
 
+import asyncio
+import functools
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import re
 from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
-from typing import Dict, List, Optional, Tuple, Any
+from bs4 import BeautifulSoup, Tag
+from typing import Dict, FrozenSet, Iterable, List, Optional, Pattern, Tuple, Any, Union
 from dataclasses import dataclass
+from collections import defaultdict
 from enum import Enum
 import hashlib
 
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# 计算页面哈希前移除的动态内容：时间戳与长哈希（如CSRF令牌）
+# 两种模式都只由[0-9a-f]组成，因此按字节匹配与按UTF-8文本匹配的结果一致
+_HASH_STRIP_RE = re.compile(rb'\d{10,}|[a-f0-9]{32,}')
+_HASH_RUN_CHARS = b'0123456789abcdef'
+_HASH_CHUNK_SIZE = 65536
+
+# 表单action/id/class中表明登录表单的关键词
+_LOGIN_KW_RE = re.compile(r'login|signin|auth|logon|登录', re.IGNORECASE)
+
+
+def _get_attr(node, name: str) -> str:
+    """读取节点属性（兼容BeautifulSoup与selectolax节点）"""
+    if isinstance(node, Tag):
+        value = node.get(name, '')
+        return ' '.join(value) if isinstance(value, list) else value
+    return node.attributes.get(name) or ''
+
+
+def _find_inputs(form, input_type: Optional[str] = None) -> List:
+    """查找表单中的input节点，可按type过滤"""
+    if isinstance(form, Tag):
+        if input_type:
+            return form.find_all('input', {'type': input_type})
+        return form.find_all('input')
+    if input_type:
+        return form.css(f'input[type="{input_type}"]')
+    return form.css('input')
+
+
+def _response_encoding(response) -> Optional[str]:
+    """返回响应头声明的charset，未声明时返回None（不触发requests的编码探测）"""
+    if 'charset' in response.headers.get('Content-Type', '').lower():
+        return response.encoding
+    return None
+
+
+def _decode_response(response) -> str:
+    """解码响应内容，替代response.text"""
+    try:
+        return response.content.decode(_response_encoding(response) or 'utf-8', errors='replace')
+    except LookupError:
+        return response.content.decode('utf-8', errors='replace')
+
+
+@functools.lru_cache(maxsize=None)
+def _field_matchers(field_names: Tuple[str, ...]) -> Tuple[FrozenSet[str], Pattern]:
+    """
+    为一组候选字段名构建匹配器
+    
+    Returns:
+        (精确匹配用的字段名集合, 模糊匹配用的忽略大小写正则)
+    """
+    return (
+        frozenset(field_names),
+        re.compile('|'.join(map(re.escape, field_names)), re.IGNORECASE)
+    )
+
+
+def _select_first(document, selector: str):
+    """按CSS选择器查找第一个匹配节点"""
+    if isinstance(document, Tag):
+        return document.select_one(selector)
+    return document.css_first(selector)
+
+
+def _select_all(document, selector: str) -> List:
+    """按CSS选择器查找所有匹配节点"""
+    if isinstance(document, Tag):
+        return document.select(selector)
+    return document.css(selector)
+
 
 class LoginStatus(Enum):
     """登录状态枚举"""
@@ -36,7 +137,7 @@ class LoginResult:
     response_time: float
     url: str
     final_url: str
-    page_changed: bool
+    page_changed: Optional[bool]  # None 表示未做页面比较
     details: Optional[Dict[str, Any]] = None
 
 
@@ -52,90 +153,544 @@ class FormInfo:
     captcha_img_url: Optional[str]
 
 
-class LoginVerifier:
-    """登录验证器"""
+@dataclass
+class _InputIndex:
+    """表单input节点索引，一次遍历后供各字段查找复用"""
+    inputs: List[Any]
+    by_type: Dict[str, List[Any]]
+    by_name: Dict[str, Any]
+    by_id: Dict[str, Any]
+    
+    @classmethod
+    def build(cls, form) -> '_InputIndex':
+        """遍历表单中的input节点并按type/name/id建立索引"""
+        inputs = _find_inputs(form)
+        by_type: Dict[str, List[Any]] = defaultdict(list)
+        by_name: Dict[str, Any] = {}
+        by_id: Dict[str, Any] = {}
+        for input_tag in inputs:
+            by_type[(_get_attr(input_tag, 'type') or 'text').lower()].append(input_tag)
+            by_name.setdefault(_get_attr(input_tag, 'name'), input_tag)
+            by_id.setdefault(_get_attr(input_tag, 'id'), input_tag)
+        return cls(inputs, by_type, by_name, by_id)
+
+
+class _LoginVerifierBase:
+    """
+    登录验证器公共部分：表单解析、关键词判定与页面哈希，不涉及网络请求
+    
+    LoginVerifier（requests）与AsyncLoginVerifier（aiohttp）各自实现请求部分。
+    """
     
     # 常见的用户名字段名
-    USERNAME_FIELDS = [
+    USERNAME_FIELDS = (
         'username', 'user', 'login', 'email', 'account', 'uin', 'id', 'name',
         'userName', 'loginName', 'userid', 'user_name', 'login_name', 'uid'
-    ]
+    )
     
     # 常见的密码字段名
-    PASSWORD_FIELDS = [
+    PASSWORD_FIELDS = (
         'password', 'pwd', 'pass', 'passwd', 'secret', 'key',
         'passWord', 'login_password', 'user_pwd', 'loginPwd'
-    ]
+    )
     
     # 常见的验证码字段名
-    CAPTCHA_FIELDS = [
+    CAPTCHA_FIELDS = (
         'captcha', 'code', 'verify', 'authcode', 'vcode', 'checkcode',
         'verifyCode', 'captchaCode', 'imgCode', 'validateCode', 'yzm'
-    ]
+    )
+    
+    # 验证码图片选择器（按优先级排列）
+    CAPTCHA_SELECTORS = (
+        'img[src*="captcha"]',
+        'img[src*="code"]',
+        'img[src*="verify"]',
+        'img[src*="yzm"]',
+        'img[alt*="验证码"]',
+        'img[alt*="captcha"]',
+        '.captcha img',
+        '#captcha img',
+        '.verify-code img',
+    )
+    _CAPTCHA_SELECTOR = ','.join(CAPTCHA_SELECTORS)
     
+    # 以下关键词在类定义时统一转为小写，匹配时直接与小写化的页面内容比较
     # 登录成功关键词
-    SUCCESS_KEYWORDS = [
+    SUCCESS_KEYWORDS = tuple(s.lower() for s in (
         '欢迎', 'welcome', 'dashboard', 'logout', '退出', '主页', 'home',
         'profile', '设置', 'settings', 'admin', '用户中心', 'success',
         '登录成功', '成功', '个人中心', '控制台', '管理'
-    ]
+    ))
     
     # 登录失败关键词
-    FAILURE_KEYWORDS = [
+    FAILURE_KEYWORDS = tuple(s.lower() for s in (
         '错误', 'error', '失败', 'failed', 'invalid', '用户名', '密码',
         '验证码', 'captcha', '登录', 'login', 'incorrect', 'wrong',
         '不正确', '不存在', '重新输入', '密码错误', '账号', '不匹配'
-    ]
+    ))
     
     # 密码错误特定关键词
-    PASSWORD_ERROR_KEYWORDS = [
+    PASSWORD_ERROR_KEYWORDS = tuple(s.lower() for s in (
         '密码错误', '密码不正确', 'password incorrect', 'wrong password',
         'invalid password', '密码不匹配', '密码有误'
-    ]
+    ))
     
     # 用户名错误特定关键词
-    USERNAME_ERROR_KEYWORDS = [
+    USERNAME_ERROR_KEYWORDS = tuple(s.lower() for s in (
         '用户名不存在', '账号不存在', 'user not found', 'account not exist',
         '用户不存在', '账号错误', 'invalid username'
-    ]
+    ))
     
     # 验证码错误特定关键词
-    CAPTCHA_ERROR_KEYWORDS = [
+    CAPTCHA_ERROR_KEYWORDS = tuple(s.lower() for s in (
         '验证码错误', '验证码不正确', 'captcha error', 'invalid captcha',
         '验证码已过期', '验证码失效', 'wrong captcha'
-    ]
+    ))
+    
+    # 默认请求头
+    DEFAULT_HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'zh-CN,zh;q=0.9,en;q=0.8',
+        'Accept-Encoding': 'gzip, deflate',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+    }
+    
+    # 请求异常分类（超时 / 连接失败），由_error_result转换为LoginResult，子类按所用HTTP库定义
+    _TIMEOUT_ERRORS: Tuple[type, ...] = ()
+    _CONNECTION_ERRORS: Tuple[type, ...] = ()
+    
+    # 关键词分类，供单次扫描使用
+    _KEYWORD_GROUPS = (
+        ('password_error', PASSWORD_ERROR_KEYWORDS),
+        ('username_error', USERNAME_ERROR_KEYWORDS),
+        ('captcha_error', CAPTCHA_ERROR_KEYWORDS),
+        ('success', SUCCESS_KEYWORDS),
+        ('failure', FAILURE_KEYWORDS),
+    )
+    
+    def normalize_url(self, url: str) -> str:
+        """标准化URL"""
+        url = url.strip()
+        if not url.startswith(('http://', 'https://')):
+            url = 'http://' + url
+        return url
+    
+    def _parse_form_info(
+        self,
+        html: Union[str, bytes],
+        url: str,
+        encoding: Optional[str] = None
+    ) -> Optional[FormInfo]:
+        """
+        从登录页面内容中解析表单信息
+        
+        Args:
+            html: 页面内容（str或原始bytes）
+            url: 页面URL，用于补全相对地址
+            encoding: html为bytes时的编码
+            
+        Returns:
+            FormInfo或None
+        """
+        if SELECTOLAX_AVAILABLE:
+            if isinstance(html, bytes):
+                html = html.decode(encoding or 'utf-8', errors='replace')
+            document = LexborHTMLParser(html)
+            forms = document.css('form')
+        else:
+            if isinstance(html, bytes):
+                document = BeautifulSoup(html, HTML_PARSER, from_encoding=encoding)
+            else:
+                document = BeautifulSoup(html, HTML_PARSER)
+            forms = document.find_all('form')
+        
+        # 查找最可能的登录表单
+        login_form = self._find_login_form(forms)
+        if not login_form:
+            return None
+        
+        # 解析表单信息
+        action = _get_attr(login_form, 'action')
+        if action and not action.startswith(('http://', 'https://')):
+            action = urljoin(url, action)
+        elif not action:
+            action = url
+            
+        method = (_get_attr(login_form, 'method') or 'POST').upper()
+        
+        # 查找输入字段（只遍历一次表单中的input）
+        index = _InputIndex.build(login_form)
+        username_field = self._find_field(login_form, self.USERNAME_FIELDS, 'text', index)
+        password_field = self._find_field(login_form, self.PASSWORD_FIELDS, 'password', index)
+        captcha_field = self._find_field(login_form, self.CAPTCHA_FIELDS, 'text', index)
+        
+        # 获取隐藏字段
+        hidden_fields = self._get_hidden_fields(login_form, index)
+        
+        # 查找验证码图片（表单没有验证码字段时无需查找）
+        captcha_img_url = self._find_captcha_image(document, url) if captcha_field else None
+        
+        if not username_field or not password_field:
+            return None
+            
+        return FormInfo(
+            action=action,
+            method=method,
+            username_field=username_field,
+            password_field=password_field,
+            captcha_field=captcha_field,
+            hidden_fields=hidden_fields,
+            captcha_img_url=captcha_img_url
+        )
     
-    def __init__(self, timeout: int = 30, verify_ssl: bool = True):
+    def invalidate_form_cache(self, url: Optional[str] = None):
+        """
+        清除表单缓存（如目标的CSRF令牌已轮换）
+        
+        Args:
+            url: 要清除的登录页面URL，为None时清除全部
+        """
+        if url is None:
+            self._form_cache.clear()
+        else:
+            self._form_cache.pop(self.normalize_url(url), None)
+    
+    def _find_login_form(self, forms: List) -> Optional[Any]:
+        """查找登录表单"""
+        for form in forms:
+            # 检查是否包含密码字段
+            password_inputs = _find_inputs(form, 'password')
+            if password_inputs:
+                return form
+            
+            # 检查表单action或id是否包含login相关关键词
+            if (_LOGIN_KW_RE.search(_get_attr(form, 'action'))
+                    or _LOGIN_KW_RE.search(_get_attr(form, 'id'))
+                    or _LOGIN_KW_RE.search(_get_attr(form, 'class'))):
+                return form
+        
+        return forms[0] if forms else None
+    
+    def _find_field(
+        self,
+        form,
+        field_names: Tuple[str, ...],
+        input_type: str,
+        index: Optional[_InputIndex] = None
+    ) -> Optional[str]:
+        """查找表单字段"""
+        if index is None:
+            index = _InputIndex.build(form)
+        
+        # 首先按类型查找
+        if input_type == 'password':
+            inputs = index.by_type.get('password')
+            if inputs:
+                return _get_attr(inputs[0], 'name')
+        
+        name_set, name_re = _field_matchers(tuple(field_names))
+        
+        # 按名称查找：精确匹配，按候选字段名的优先级顺序
+        if not (name_set.isdisjoint(index.by_name) and name_set.isdisjoint(index.by_id)):
+            for name in field_names:
+                if name in index.by_name:
+                    return name
+                if name in index.by_id:
+                    return _get_attr(index.by_id[name], 'name') or name
+        
+        # 模糊匹配
+        for input_tag in index.inputs:
+            if (name_re.search(_get_attr(input_tag, 'name'))
+                    or name_re.search(_get_attr(input_tag, 'id'))
+                    or name_re.search(_get_attr(input_tag, 'placeholder'))):
+                return _get_attr(input_tag, 'name')
+        
+        return None
+    
+    def _get_hidden_fields(self, form, index: Optional[_InputIndex] = None) -> Dict[str, str]:
+        """获取隐藏字段"""
+        if index is None:
+            index = _InputIndex.build(form)
+        
+        hidden_fields = {}
+        for input_tag in index.by_type.get('hidden', ()):
+            name = _get_attr(input_tag, 'name')
+            value = _get_attr(input_tag, 'value')
+            if name:
+                hidden_fields[name] = value
+        return hidden_fields
+    
+    def _find_captcha_image(self, document, base_url: str) -> Optional[str]:
+        """查找验证码图片"""
+        # 合并选择器只遍历一次DOM；多数页面没有验证码图片，可直接返回
+        candidates = [img for img in _select_all(document, self._CAPTCHA_SELECTOR)
+                      if _get_attr(img, 'src')]
+        if not candidates:
+            return None
+        
+        img = candidates[0]
+        if len(candidates) > 1:
+            # 多个候选时按选择器优先级选取
+            for selector in self.CAPTCHA_SELECTORS:
+                img = _select_first(document, selector)
+                if img is not None and _get_attr(img, 'src'):
+                    break
+            else:
+                img = candidates[0]
+        
+        src = _get_attr(img, 'src')
+        if not src.startswith(('http://', 'https://')):
+            src = urljoin(base_url, src)
+        return src
+    
+    def _error_result(self, error: Exception, url: str, start_time: float) -> LoginResult:
+        """将请求异常转换为LoginResult"""
+        if isinstance(error, self._TIMEOUT_ERRORS):
+            status, message = LoginStatus.CONNECTION_ERROR, "请求超时"
+        elif isinstance(error, self._CONNECTION_ERRORS):
+            status, message = LoginStatus.CONNECTION_ERROR, "无法连接到服务器"
+        else:
+            status, message = LoginStatus.UNKNOWN_ERROR, f"登录过程中出现错误: {str(error)}"
+        
+        return LoginResult(
+            status=status,
+            success=False,
+            message=message,
+            response_time=time.time() - start_time,
+            url=url,
+            final_url=url,
+            page_changed=False
+        )
+    
+    def _get_content_hash(self, content: Union[str, bytes, Iterable[bytes]]) -> str:
+        """
+        获取内容哈希（仅用于比较页面是否变化，无需密码学强度）
+        
+        Args:
+            content: 页面文本、原始字节或字节块迭代器（如response.iter_content()）
+            
+        Returns:
+            十六进制哈希字符串
+        """
+        if isinstance(content, str):
+            content = content.encode('utf-8', 'ignore')
+        if isinstance(content, bytes):
+            content = (content,)
+        
+        hasher = xxhash.xxh3_64() if XXHASH_AVAILABLE else hashlib.blake2b(digest_size=16)
+        
+        # 移除可能变化的内容（如时间戳、CSRF令牌等）
+        # 块末尾的[0-9a-f]连续串可能延续到下一块，暂存后与下一块拼接再处理
+        carry = b''
+        for chunk in content:
+            if not chunk:
+                continue
+            buf = carry + chunk
+            cut = len(buf.rstrip(_HASH_RUN_CHARS))
+            hasher.update(_HASH_STRIP_RE.sub(b'', buf[:cut]))
+            carry = buf[cut:]
+        hasher.update(_HASH_STRIP_RE.sub(b'', carry))
+        return hasher.hexdigest()
+    
+    def _analyze_login_result(
+        self, 
+        content: str, 
+        final_url: str, 
+        original_url: str,
+        page_changed: Optional[bool],
+        url_changed: bool
+    ) -> Tuple[LoginStatus, str]:
+        """
+        分析登录结果
+        
+        Args:
+            content: 响应内容
+            final_url: 最终URL
+            original_url: 原始URL
+            page_changed: 页面是否变化，None表示未比较（仅依据关键词和URL变化判断）
+            url_changed: URL是否变化
+            
+        Returns:
+            (登录状态, 消息)
+        """
+        # 有Aho-Corasick时单次扫描全部关键词；否则按分类逐个匹配，结果已确定即停止
+        hits = self._match_keywords(content) if _KEYWORD_AUTOMATON is not None else None
+        
+        # 检查密码错误关键词
+        keyword = self._first_keyword(content, 'password_error', hits)
+        if keyword:
+            return LoginStatus.PASSWORD_ERROR, f"密码错误: 检测到关键词 '{keyword}'"
+        
+        # 检查用户名错误关键词
+        keyword = self._first_keyword(content, 'username_error', hits)
+        if keyword:
+            return LoginStatus.USERNAME_ERROR, f"用户名错误: 检测到关键词 '{keyword}'"
+        
+        # 检查验证码错误关键词
+        keyword = self._first_keyword(content, 'captcha_error', hits)
+        if keyword:
+            return LoginStatus.CAPTCHA_ERROR, f"验证码错误: 检测到关键词 '{keyword}'"
+        
+        # 综合判断
+        # 情况1: URL明显变化（如跳转到dashboard、home等），无需统计关键词
+        final_path = urlparse(final_url).path.lower()
+        success_paths = ['dashboard', 'home', 'index', 'main', 'admin', 'welcome', 'user']
+        if url_changed and any(p in final_path for p in success_paths):
+            return LoginStatus.SUCCESS, f"登录成功: 页面跳转到 {final_url}"
+        
+        # 成功/失败关键词数量（失败关键词只需统计到能确定与成功数量的大小关系为止）
+        success_count, _ = self._count_keywords(content, 'success', hits)
+        failure_count, failure_exact = self._count_keywords(
+            content, 'failure', hits, compare_to=success_count
+        )
+        
+        # 情况2: 成功关键词多于失败关键词，且页面发生变化（未比较页面时仅看关键词）
+        if success_count > failure_count and page_changed is None:
+            return LoginStatus.SUCCESS, f"登录成功: 检测到{success_count}个成功关键词"
+        if success_count > failure_count and page_changed:
+            return LoginStatus.SUCCESS, f"登录成功: 检测到{success_count}个成功关键词，页面已变化"
+        
+        # 情况3: 失败关键词更多
+        if failure_count > 0 and failure_count >= success_count:
+            # 提前停止统计时只知道下限
+            prefix = "" if failure_exact else "至少"
+            return LoginStatus.PASSWORD_ERROR, f"登录失败: 检测到{prefix}{failure_count}个失败关键词"
+        
+        # 情况4: 页面没有变化，可能登录失败
+        if page_changed is False and not url_changed:
+            return LoginStatus.PASSWORD_ERROR, "登录失败: 页面无变化"
+        
+        # 情况5: 只有页面变化，无法确定
+        if page_changed:
+            return LoginStatus.SUCCESS, "可能登录成功: 页面发生变化，请人工确认"
+        
+        return LoginStatus.UNKNOWN_ERROR, "无法确定登录状态，请人工确认"
+    
+    def _first_keyword(
+        self,
+        content: str,
+        category: str,
+        hits: Optional[Dict[str, set]] = None
+    ) -> Optional[str]:
+        """按定义顺序返回该分类中第一个命中的关键词"""
+        for keyword, pattern in _KEYWORD_PATTERNS[category]:
+            if hits is not None:
+                if keyword in hits[category]:
+                    return keyword
+            elif pattern.search(content) if pattern else keyword in content:
+                return keyword
+        return None
+    
+    def _count_keywords(
+        self,
+        content: str,
+        category: str,
+        hits: Optional[Dict[str, set]] = None,
+        compare_to: Optional[int] = None
+    ) -> Tuple[int, bool]:
+        """
+        统计该分类命中的关键词数量
+        
+        Args:
+            content: 响应内容
+            category: 关键词分类
+            hits: _match_keywords的结果（可选，提供时直接计数）
+            compare_to: 只需确定计数与该值的大小关系时传入，关系确定后提前停止
+            
+        Returns:
+            (命中数量, 是否为精确值)，提前停止时数量为已统计到的下限
+        """
+        if hits is not None:
+            return len(hits[category]), True
+        
+        patterns = _KEYWORD_PATTERNS[category]
+        count = 0
+        for index, (keyword, pattern) in enumerate(patterns):
+            if pattern.search(content) if pattern else keyword in content:
+                count += 1
+            if compare_to is not None:
+                remaining = len(patterns) - index - 1
+                # 已确定 count >= compare_to（且非零），或剩余关键词全部命中也追不上
+                if remaining and ((count and count >= compare_to) or count + remaining < compare_to):
+                    return count, False
+        return count, True
+    
+    def _match_keywords(self, content: str) -> Dict[str, set]:
+        """
+        扫描内容，返回各分类命中的关键词（大小写不敏感）
+        
+        Args:
+            content: 响应内容
+            
+        Returns:
+            {分类: 命中的关键词集合}
+        """
+        hits = {category: set() for category, _ in self._KEYWORD_GROUPS}
+        if _KEYWORD_AUTOMATON is not None:
+            for _, entries in _KEYWORD_AUTOMATON.iter(content.lower()):
+                for category, keyword in entries:
+                    hits[category].add(keyword)
+        else:
+            # 逐关键词匹配，无需复制一份小写化的整页内容
+            for category, patterns in _KEYWORD_PATTERNS.items():
+                for keyword, pattern in patterns:
+                    if pattern.search(content) if pattern else keyword in content:
+                        hits[category].add(keyword)
+        return hits
+
+
+class LoginVerifier(_LoginVerifierBase):
+    """登录验证器"""
+    
+    _TIMEOUT_ERRORS = (requests.exceptions.Timeout,)
+    _CONNECTION_ERRORS = (requests.exceptions.ConnectionError,)
+    
+    def __init__(self, timeout: int = 30, verify_ssl: bool = True, cache_forms: bool = False):
         """
         初始化登录验证器
         
         Args:
             timeout: 请求超时时间（秒）
             verify_ssl: 是否验证SSL证书
+            cache_forms: 是否缓存已分析的表单（含隐藏字段，见verify_login说明）
         """
         self.timeout = timeout
         self.verify_ssl = verify_ssl
+        self.cache_forms = cache_forms
         self.session = requests.Session()
         self._setup_session()
         
+        # analyze_login_form最近一次获取的页面 (请求URL, 响应)，供verify_login复用
+        self._last_page: Optional[Tuple[str, requests.Response]] = None
+        
+        # 已分析的表单信息，按标准化URL缓存（仅cache_forms开启时使用）
+        self._form_cache: Dict[str, FormInfo] = {}
+        
+        # 登录POST请求模板，按表单action缓存（已合并会话请求头）
+        self._prepared_cache: Dict[str, requests.PreparedRequest] = {}
+        
     def _setup_session(self):
         """设置会话"""
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'zh-CN,zh;q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        })
+        self.session.headers.update(self.DEFAULT_HEADERS)
+        
+        # 扩大连接池以便批量验证时复用keep-alive连接；只重试建立连接阶段的失败，
+        # 读超时和5xx响应不重试，避免重复提交登录
+        adapter = HTTPAdapter(
+            pool_connections=64,
+            pool_maxsize=64,
+            max_retries=Retry(
+                total=2,
+                connect=2,
+                read=False,
+                status=0,
+                backoff_factor=0.2
+            )
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         
-    def normalize_url(self, url: str) -> str:
-        """标准化URL"""
-        url = url.strip()
-        if not url.startswith(('http://', 'https://')):
-            url = 'http://' + url
-        return url
-    
     def test_connection(self, url: str) -> Tuple[bool, str]:
         """
         测试目标连接
@@ -175,6 +730,7 @@ class LoginVerifier:
         Returns:
             FormInfo或None
         """
+        self._last_page = None
         try:
             url = self.normalize_url(url)
             response = self.session.get(
@@ -183,136 +739,18 @@ class LoginVerifier:
                 verify=self.verify_ssl
             )
             response.raise_for_status()
+            self._last_page = (url, response)
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            forms = soup.find_all('form')
-            
-            # 查找最可能的登录表单
-            login_form = self._find_login_form(forms)
-            if not login_form:
-                return None
-            
-            # 解析表单信息
-            action = login_form.get('action', '')
-            if action and not action.startswith(('http://', 'https://')):
-                action = urljoin(url, action)
-            elif not action:
-                action = url
-                
-            method = login_form.get('method', 'POST').upper()
-            
-            # 查找输入字段
-            username_field = self._find_field(login_form, self.USERNAME_FIELDS, 'text')
-            password_field = self._find_field(login_form, self.PASSWORD_FIELDS, 'password')
-            captcha_field = self._find_field(login_form, self.CAPTCHA_FIELDS, 'text')
-            
-            # 获取隐藏字段
-            hidden_fields = self._get_hidden_fields(login_form)
-            
-            # 查找验证码图片
-            captcha_img_url = self._find_captcha_image(soup, url)
-            
-            if not username_field or not password_field:
-                return None
-                
-            return FormInfo(
-                action=action,
-                method=method,
-                username_field=username_field,
-                password_field=password_field,
-                captcha_field=captcha_field,
-                hidden_fields=hidden_fields,
-                captcha_img_url=captcha_img_url
-            )
+            return self._parse_form_info(response.content, url, _response_encoding(response))
             
         except Exception as e:
             return None
     
-    def _find_login_form(self, forms: List) -> Optional[Any]:
-        """查找登录表单"""
-        for form in forms:
-            # 检查是否包含密码字段
-            password_inputs = form.find_all('input', {'type': 'password'})
-            if password_inputs:
-                return form
-            
-            # 检查表单action或id是否包含login相关关键词
-            action = form.get('action', '').lower()
-            form_id = form.get('id', '').lower()
-            form_class = ' '.join(form.get('class', [])).lower()
-            
-            login_keywords = ['login', 'signin', 'auth', 'logon', '登录']
-            if any(kw in action or kw in form_id or kw in form_class for kw in login_keywords):
-                return form
-        
-        return forms[0] if forms else None
-    
-    def _find_field(self, form, field_names: List[str], input_type: str) -> Optional[str]:
-        """查找表单字段"""
-        # 首先按类型查找
-        if input_type == 'password':
-            inputs = form.find_all('input', {'type': 'password'})
-            if inputs:
-                return inputs[0].get('name', '')
-        
-        # 按名称查找
-        for name in field_names:
-            # 精确匹配
-            input_tag = form.find('input', {'name': name})
-            if input_tag:
-                return name
-            
-            input_tag = form.find('input', {'id': name})
-            if input_tag:
-                return input_tag.get('name', name)
-        
-        # 模糊匹配
-        for input_tag in form.find_all('input'):
-            input_name = input_tag.get('name', '').lower()
-            input_id = input_tag.get('id', '').lower()
-            input_placeholder = input_tag.get('placeholder', '').lower()
-            
-            for name in field_names:
-                if name in input_name or name in input_id or name in input_placeholder:
-                    return input_tag.get('name', '')
-        
-        return None
-    
-    def _get_hidden_fields(self, form) -> Dict[str, str]:
-        """获取隐藏字段"""
-        hidden_fields = {}
-        for input_tag in form.find_all('input', {'type': 'hidden'}):
-            name = input_tag.get('name', '')
-            value = input_tag.get('value', '')
-            if name:
-                hidden_fields[name] = value
-        return hidden_fields
-    
-    def _find_captcha_image(self, soup: BeautifulSoup, base_url: str) -> Optional[str]:
-        """查找验证码图片"""
-        captcha_selectors = [
-            'img[src*="captcha"]',
-            'img[src*="code"]',
-            'img[src*="verify"]',
-            'img[src*="yzm"]',
-            'img[alt*="验证码"]',
-            'img[alt*="captcha"]',
-            '.captcha img',
-            '#captcha img',
-            '.verify-code img',
-        ]
-        
-        for selector in captcha_selectors:
-            try:
-                img = soup.select_one(selector)
-                if img and img.get('src'):
-                    src = img['src']
-                    if not src.startswith(('http://', 'https://')):
-                        src = urljoin(base_url, src)
-                    return src
-            except:
-                continue
-        
+    def _take_cached_page(self, url: str) -> Optional[requests.Response]:
+        """取出analyze_login_form缓存的页面响应（仅可使用一次）"""
+        cached, self._last_page = self._last_page, None
+        if cached and cached[0] == url:
+            return cached[1]
         return None
     
     def get_captcha_image(self, url: str) -> Optional[bytes]:
@@ -342,17 +780,24 @@ class LoginVerifier:
         username: str, 
         password: str, 
         captcha: str = "",
-        form_info: Optional[FormInfo] = None
+        form_info: Optional[FormInfo] = None,
+        skip_page_diff: bool = False
     ) -> LoginResult:
         """
         执行登录验证
         
+        开启cache_forms时，skip_page_diff的验证会复用缓存的表单，其中的隐藏字段
+        （如CSRF令牌）来自首次分析的页面，令牌轮换后需调用invalidate_form_cache。
+        不跳过页面比较时本来就要获取登录页，因此总是重新分析以取得最新的隐藏字段。
+        
         Args:
             url: 登录页面URL
             username: 用户名
             password: 密码
             captcha: 验证码（可选）
             form_info: 表单信息（可选，如果不提供则自动分析）
+            skip_page_diff: 跳过登录前页面获取与哈希比较，仅依据关键词和URL变化判断
+                （批量验证同一表单时可省去每次一个GET请求）
             
         Returns:
             LoginResult
@@ -361,10 +806,18 @@ class LoginVerifier:
         url = self.normalize_url(url)
         
         try:
-            # 如果没有提供表单信息，自动分析
+            pre_login_response = None
+            
+            # 如果没有提供表单信息，自动分析（跳过页面比较时可使用缓存）
+            if not form_info and skip_page_diff and self.cache_forms:
+                form_info = self._form_cache.get(url)
             if not form_info:
                 form_info = self.analyze_login_form(url)
-                if not form_info:
+                pre_login_response = self._take_cached_page(url)
+                if form_info:
+                    if self.cache_forms:
+                        self._form_cache[url] = form_info
+                else:
                     return LoginResult(
                         status=LoginStatus.FORM_NOT_FOUND,
                         success=False,
@@ -375,47 +828,41 @@ class LoginVerifier:
                         page_changed=False
                     )
             
-            # 获取登录前的页面内容哈希（用于比较页面变化）
-            pre_login_response = self.session.get(url, timeout=self.timeout, verify=self.verify_ssl)
-            pre_login_hash = self._get_content_hash(pre_login_response.text)
-            pre_login_url = pre_login_response.url
-            
-            # 构建登录数据
-            login_data = form_info.hidden_fields.copy()
-            login_data[form_info.username_field] = username
-            login_data[form_info.password_field] = password
-            
-            if form_info.captcha_field and captcha:
-                login_data[form_info.captcha_field] = captcha
+            # 获取登录前的页面内容哈希（用于比较页面变化），优先复用表单分析时获取的页面
+            if skip_page_diff:
+                pre_login_hash = None
+                pre_login_url = url
+            elif pre_login_response is None:
+                # 流式计算哈希，无需在内存中保留整个页面
+                with self.session.get(
+                    url, timeout=self.timeout, verify=self.verify_ssl, stream=True
+                ) as pre_login_response:
+                    pre_login_hash = self._get_content_hash(
+                        pre_login_response.iter_content(_HASH_CHUNK_SIZE)
+                    )
+                pre_login_url = pre_login_response.url
+            else:
+                pre_login_hash = self._get_content_hash(pre_login_response.content)
+                pre_login_url = pre_login_response.url
             
             # 发送登录请求
-            if form_info.method == 'POST':
-                response = self.session.post(
-                    form_info.action,
-                    data=login_data,
-                    timeout=self.timeout,
-                    verify=self.verify_ssl,
-                    allow_redirects=True
-                )
-            else:
-                response = self.session.get(
-                    form_info.action,
-                    params=login_data,
-                    timeout=self.timeout,
-                    verify=self.verify_ssl,
-                    allow_redirects=True
-                )
+            response = self._submit_login(form_info, username, password, captcha)
             
             response_time = time.time() - start_time
             
             # 分析登录结果
-            post_login_hash = self._get_content_hash(response.text)
-            page_changed = pre_login_hash != post_login_hash
+            if pre_login_hash is None:
+                post_login_hash = None
+                page_changed = None
+            else:
+                post_login_hash = self._get_content_hash(response.content)
+                page_changed = pre_login_hash != post_login_hash
             url_changed = pre_login_url != response.url
             
             # 判断登录状态
+            content = _decode_response(response)
             status, message = self._analyze_login_result(
-                response.text, 
+                content, 
                 response.url, 
                 url,
                 page_changed,
@@ -433,134 +880,557 @@ class LoginVerifier:
                 details={
                     'url_changed': url_changed,
                     'status_code': response.status_code,
-                    'content_length': len(response.text),
-                    'pre_login_hash': pre_login_hash[:16],
-                    'post_login_hash': post_login_hash[:16]
+                    'content_length': len(content),
+                    'pre_login_hash': pre_login_hash[:16] if pre_login_hash else None,
+                    'post_login_hash': post_login_hash[:16] if post_login_hash else None
                 }
             )
             
-        except requests.exceptions.Timeout:
-            return LoginResult(
-                status=LoginStatus.CONNECTION_ERROR,
-                success=False,
-                message="请求超时",
-                response_time=time.time() - start_time,
-                url=url,
-                final_url=url,
-                page_changed=False
+        except Exception as e:
+            return self._error_result(e, url, start_time)
+    
+    def verify_login_fast(
+        self,
+        form_info: FormInfo,
+        username: str,
+        password: str,
+        captcha: str = ""
+    ) -> LoginResult:
+        """
+        已知表单的快速验证：只发送登录请求并分析结果
+        
+        不获取登录页面、不解析HTML、不比较页面变化，适合对同一表单批量验证。
+        隐藏字段（如CSRF令牌）直接取自form_info，令牌失效时需由调用方
+        重新调用analyze_login_form刷新。
+        
+        Args:
+            form_info: 已分析的表单信息
+            username: 用户名
+            password: 密码
+            captcha: 验证码（可选）
+            
+        Returns:
+            LoginResult（page_changed为None，url_changed表示登录请求是否发生跳转）
+        """
+        start_time = time.time()
+        url = form_info.action
+        
+        try:
+            response = self._submit_login(form_info, username, password, captcha)
+            response_time = time.time() - start_time
+            
+            url_changed = url != response.url
+            content = _decode_response(response)
+            status, message = self._analyze_login_result(
+                content,
+                response.url,
+                url,
+                None,
+                url_changed
             )
-        except requests.exceptions.ConnectionError:
+            
             return LoginResult(
-                status=LoginStatus.CONNECTION_ERROR,
-                success=False,
-                message="无法连接到服务器",
-                response_time=time.time() - start_time,
+                status=status,
+                success=(status == LoginStatus.SUCCESS),
+                message=message,
+                response_time=response_time,
                 url=url,
-                final_url=url,
-                page_changed=False
+                final_url=response.url,
+                page_changed=None,
+                details={
+                    'url_changed': url_changed,
+                    'status_code': response.status_code,
+                    'content_length': len(content)
+                }
             )
+            
         except Exception as e:
-            return LoginResult(
-                status=LoginStatus.UNKNOWN_ERROR,
-                success=False,
-                message=f"登录过程中出现错误: {str(e)}",
-                response_time=time.time() - start_time,
-                url=url,
-                final_url=url,
-                page_changed=False
+            return self._error_result(e, url, start_time)
+    
+    def _submit_login(
+        self,
+        form_info: FormInfo,
+        username: str,
+        password: str,
+        captcha: str = ""
+    ) -> requests.Response:
+        """按表单信息构建登录数据并发送登录请求"""
+        login_data = form_info.hidden_fields.copy()
+        login_data[form_info.username_field] = username
+        login_data[form_info.password_field] = password
+        
+        if form_info.captcha_field and captcha:
+            login_data[form_info.captcha_field] = captcha
+        
+        if form_info.method == 'POST':
+            prepared = self._prepare_login_post(form_info.action, login_data)
+            # session.send不会读取环境变量中的代理/CA配置，需与session.request一样手动合并
+            settings = self.session.merge_environment_settings(
+                prepared.url, {}, None, self.verify_ssl, None
             )
+            return self.session.send(
+                prepared,
+                timeout=self.timeout,
+                allow_redirects=True,
+                **settings
+            )
+        return self.session.get(
+            form_info.action,
+            params=login_data,
+            timeout=self.timeout,
+            verify=self.verify_ssl,
+            allow_redirects=True
+        )
     
-    def _get_content_hash(self, content: str) -> str:
-        """获取内容哈希"""
-        # 移除可能变化的内容（如时间戳、CSRF令牌等）
-        cleaned = re.sub(r'\d{10,}', '', content)  # 移除时间戳
-        cleaned = re.sub(r'[a-f0-9]{32,}', '', cleaned)  # 移除长哈希
-        return hashlib.md5(cleaned.encode()).hexdigest()
+    def _prepare_login_post(self, action: str, login_data: Dict[str, str]) -> requests.PreparedRequest:
+        """基于缓存的请求模板构建登录POST请求，每次只重建请求体和Cookie"""
+        template = self._prepared_cache.get(action)
+        if template is None:
+            template = self.session.prepare_request(requests.Request('POST', action))
+            self._prepared_cache[action] = template
+        
+        prepared = template.copy()
+        prepared.prepare_body(login_data, None)
+        # 会话Cookie可能在获取登录页后更新，不能沿用模板中的Cookie头
+        prepared.headers.pop('Cookie', None)
+        prepared.prepare_cookies(self.session.cookies)
+        return prepared
     
-    def _analyze_login_result(
-        self, 
-        content: str, 
-        final_url: str, 
-        original_url: str,
-        page_changed: bool,
-        url_changed: bool
-    ) -> Tuple[LoginStatus, str]:
+    def close(self):
+        """关闭会话"""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class AsyncLoginVerifier(_LoginVerifierBase):
+    """
+    异步登录验证器
+    
+    基于aiohttp连接池并发验证多个目标，表单解析、关键词扫描和页面哈希与LoginVerifier共用。
+    使用前需通过 async with 或 start() 打开会话。
+    """
+    
+    _TIMEOUT_ERRORS = (asyncio.TimeoutError,)
+    _CONNECTION_ERRORS = (aiohttp.ClientConnectionError,)
+    
+    def __init__(
+        self,
+        timeout: int = 30,
+        verify_ssl: bool = True,
+        limit: int = 100,
+        limit_per_host: int = 10,
+        cache_forms: bool = False
+    ):
         """
-        分析登录结果
+        初始化异步登录验证器
         
         Args:
-            content: 响应内容
-            final_url: 最终URL
-            original_url: 原始URL
-            page_changed: 页面是否变化
-            url_changed: URL是否变化
+            timeout: 请求超时时间（秒）
+            verify_ssl: 是否验证SSL证书
+            limit: 连接池总连接数上限
+            limit_per_host: 单个主机的连接数上限
+            cache_forms: 是否缓存已分析的表单（含隐藏字段，见verify_login说明）
+        """
+        self.timeout = timeout
+        self.verify_ssl = verify_ssl
+        self.cache_forms = cache_forms
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._connector: Optional[aiohttp.TCPConnector] = None
+        
+        # 已分析的表单信息，按标准化URL缓存（仅cache_forms开启时使用）
+        self._form_cache: Dict[str, FormInfo] = {}
+    
+    async def start(self):
+        """创建连接池与aiohttp会话"""
+        if self.session is not None:
+            return
+        self._connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            ssl=None if self.verify_ssl else False
+        )
+        self.session = self._new_session()
+    
+    def _new_session(self) -> aiohttp.ClientSession:
+        """创建共享连接池的会话；除self.session外，连接池归self.session所有"""
+        return aiohttp.ClientSession(
+            connector=self._connector,
+            connector_owner=self.session is None,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            headers=self.DEFAULT_HEADERS
+        )
+    
+    def _require_session(self) -> aiohttp.ClientSession:
+        """返回已打开的会话，未打开时抛出RuntimeError"""
+        if self.session is None:
+            raise RuntimeError("AsyncLoginVerifier会话未打开，请使用 async with 或先调用 start()")
+        return self.session
+    
+    async def close(self):
+        """关闭会话（同时关闭连接池）"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+            self._connector = None
+    
+    async def __aenter__(self):
+        await self.start()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+    
+    @staticmethod
+    def _decode_body(body: bytes, charset: Optional[str]) -> str:
+        """按响应声明的编码解码内容"""
+        try:
+            return body.decode(charset or 'utf-8', errors='replace')
+        except LookupError:
+            return body.decode('utf-8', errors='replace')
+    
+    async def _fetch(
+        self,
+        session: aiohttp.ClientSession,
+        method: str,
+        url: str,
+        **kwargs
+    ) -> Tuple[str, str, int]:
+        """
+        发送请求并读取响应
+        
+        Returns:
+            (页面内容, 最终URL, 状态码)
+        """
+        async with session.request(method, url, allow_redirects=True, **kwargs) as response:
+            body = await response.read()
+            return self._decode_body(body, response.charset), str(response.url), response.status
+    
+    async def test_connection(self, url: str) -> Tuple[bool, str]:
+        """测试目标连接"""
+        session = self._require_session()
+        try:
+            url = self.normalize_url(url)
+            async with session.get(url, allow_redirects=True) as response:
+                response.raise_for_status()
+                return True, f"连接成功，状态码: {response.status}"
+        except asyncio.TimeoutError:
+            return False, "连接超时"
+        except aiohttp.ClientResponseError as e:
+            return False, f"HTTP错误: {e}"
+        except aiohttp.ClientConnectionError:
+            return False, "无法连接到目标服务器"
+        except Exception as e:
+            return False, f"连接失败: {str(e)}"
+    
+    async def analyze_login_form(self, url: str) -> Optional[FormInfo]:
+        """
+        分析登录表单
+        
+        Args:
+            url: 登录页面URL
             
         Returns:
-            (登录状态, 消息)
+            FormInfo或None
+        """
+        session = self._require_session()
+        form_info, _, _ = await self._analyze_login_page(session, self.normalize_url(url))
+        return form_info
+    
+    async def _analyze_login_page(
+        self,
+        session: aiohttp.ClientSession,
+        url: str
+    ) -> Tuple[Optional[FormInfo], Optional[str], Optional[str]]:
         """
-        content_lower = content.lower()
+        获取并分析登录页面
         
-        # 检查密码错误关键词
-        for keyword in self.PASSWORD_ERROR_KEYWORDS:
-            if keyword.lower() in content_lower:
-                return LoginStatus.PASSWORD_ERROR, f"密码错误: 检测到关键词 '{keyword}'"
+        Returns:
+            (表单信息, 页面内容, 最终URL)，请求失败时页面内容与最终URL为None
+        """
+        try:
+            async with session.get(url) as response:
+                response.raise_for_status()
+                body = await response.read()
+                charset = response.charset
+                final_url = str(response.url)
+        except Exception:
+            return None, None, None
         
-        # 检查用户名错误关键词
-        for keyword in self.USERNAME_ERROR_KEYWORDS:
-            if keyword.lower() in content_lower:
-                return LoginStatus.USERNAME_ERROR, f"用户名错误: 检测到关键词 '{keyword}'"
+        try:
+            form_info = self._parse_form_info(body, url, charset)
+        except Exception:
+            form_info = None
+        return form_info, self._decode_body(body, charset), final_url
+    
+    async def get_captcha_image(self, url: str) -> Optional[bytes]:
+        """获取验证码图片"""
+        session = self._require_session()
+        try:
+            async with session.get(url) as response:
+                response.raise_for_status()
+                return await response.read()
+        except Exception:
+            return None
+    
+    async def verify_login(
+        self,
+        url: str,
+        username: str,
+        password: str,
+        captcha: str = "",
+        form_info: Optional[FormInfo] = None,
+        skip_page_diff: bool = False
+    ) -> LoginResult:
+        """
+        执行登录验证
         
-        # 检查验证码错误关键词
-        for keyword in self.CAPTCHA_ERROR_KEYWORDS:
-            if keyword.lower() in content_lower:
-                return LoginStatus.CAPTCHA_ERROR, f"验证码错误: 检测到关键词 '{keyword}'"
-        
-        # 检查成功关键词
-        success_count = 0
-        for keyword in self.SUCCESS_KEYWORDS:
-            if keyword.lower() in content_lower:
-                success_count += 1
-        
-        # 检查失败关键词
-        failure_count = 0
-        for keyword in self.FAILURE_KEYWORDS:
-            if keyword.lower() in content_lower:
-                failure_count += 1
+        开启cache_forms时，skip_page_diff的验证会复用缓存的表单，其中的隐藏字段
+        （如CSRF令牌）来自首次分析的页面，令牌轮换后需调用invalidate_form_cache。
+        不跳过页面比较时本来就要获取登录页，因此总是重新分析以取得最新的隐藏字段。
         
-        # 综合判断
-        # 情况1: URL明显变化（如跳转到dashboard、home等）
-        final_path = urlparse(final_url).path.lower()
-        success_paths = ['dashboard', 'home', 'index', 'main', 'admin', 'welcome', 'user']
-        if url_changed and any(p in final_path for p in success_paths):
-            return LoginStatus.SUCCESS, f"登录成功: 页面跳转到 {final_url}"
+        Args:
+            url: 登录页面URL
+            username: 用户名
+            password: 密码
+            captcha: 验证码（可选）
+            form_info: 表单信息（可选，如果不提供则自动分析）
+            skip_page_diff: 跳过登录前页面获取与哈希比较，仅依据关键词和URL变化判断
+                （批量验证同一表单时可省去每次一个GET请求）
+            
+        Returns:
+            LoginResult
+        """
+        return await self._verify_login(
+            self._require_session(), url, username, password, captcha, form_info, skip_page_diff
+        )
+    
+    async def _verify_login(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        username: str,
+        password: str,
+        captcha: str = "",
+        form_info: Optional[FormInfo] = None,
+        skip_page_diff: bool = False
+    ) -> LoginResult:
+        """在指定会话中执行登录验证（参数同verify_login）"""
+        start_time = time.time()
+        url = self.normalize_url(url)
         
-        # 情况2: 成功关键词多于失败关键词，且页面发生变化
-        if success_count > failure_count and page_changed:
-            return LoginStatus.SUCCESS, f"登录成功: 检测到{success_count}个成功关键词，页面已变化"
+        try:
+            pre_login_content = None
+            pre_login_url = None
+            
+            # 如果没有提供表单信息，自动分析并复用该页面作为登录前快照（跳过页面比较时可使用缓存）
+            if not form_info and skip_page_diff and self.cache_forms:
+                form_info = self._form_cache.get(url)
+            if not form_info:
+                form_info, pre_login_content, pre_login_url = await self._analyze_login_page(session, url)
+                if form_info:
+                    if self.cache_forms:
+                        self._form_cache[url] = form_info
+                else:
+                    return LoginResult(
+                        status=LoginStatus.FORM_NOT_FOUND,
+                        success=False,
+                        message="未找到登录表单",
+                        response_time=time.time() - start_time,
+                        url=url,
+                        final_url=url,
+                        page_changed=False
+                    )
+            
+            if skip_page_diff:
+                pre_login_hash = None
+                pre_login_url = url
+            else:
+                if pre_login_content is None:
+                    pre_login_content, pre_login_url, _ = await self._fetch(session, 'GET', url)
+                pre_login_hash = self._get_content_hash(pre_login_content)
+            
+            # 发送登录请求
+            content, final_url, status_code = await self._submit_login(
+                session, form_info, username, password, captcha
+            )
+            
+            response_time = time.time() - start_time
+            
+            # 分析登录结果
+            if pre_login_hash is None:
+                post_login_hash = None
+                page_changed = None
+            else:
+                post_login_hash = self._get_content_hash(content)
+                page_changed = pre_login_hash != post_login_hash
+            url_changed = pre_login_url != final_url
+            
+            status, message = self._analyze_login_result(
+                content,
+                final_url,
+                url,
+                page_changed,
+                url_changed
+            )
+            
+            return LoginResult(
+                status=status,
+                success=(status == LoginStatus.SUCCESS),
+                message=message,
+                response_time=response_time,
+                url=url,
+                final_url=final_url,
+                page_changed=page_changed,
+                details={
+                    'url_changed': url_changed,
+                    'status_code': status_code,
+                    'content_length': len(content),
+                    'pre_login_hash': pre_login_hash[:16] if pre_login_hash else None,
+                    'post_login_hash': post_login_hash[:16] if post_login_hash else None
+                }
+            )
+            
+        except Exception as e:
+            return self._error_result(e, url, start_time)
+    
+    async def verify_login_fast(
+        self,
+        form_info: FormInfo,
+        username: str,
+        password: str,
+        captcha: str = ""
+    ) -> LoginResult:
+        """
+        已知表单的快速验证：只发送登录请求并分析结果
         
-        # 情况3: 失败关键词更多
-        if failure_count > 0 and failure_count >= success_count:
-            return LoginStatus.PASSWORD_ERROR, f"登录失败: 检测到{failure_count}个失败关键词"
+        隐藏字段（如CSRF令牌）直接取自form_info，令牌失效时需由调用方刷新。
+        """
+        session = self._require_session()
+        start_time = time.time()
+        url = form_info.action
         
-        # 情况4: 页面没有变化，可能登录失败
-        if not page_changed and not url_changed:
-            return LoginStatus.PASSWORD_ERROR, "登录失败: 页面无变化"
+        try:
+            content, final_url, status_code = await self._submit_login(
+                session, form_info, username, password, captcha
+            )
+            response_time = time.time() - start_time
+            
+            url_changed = url != final_url
+            status, message = self._analyze_login_result(
+                content,
+                final_url,
+                url,
+                None,
+                url_changed
+            )
+            
+            return LoginResult(
+                status=status,
+                success=(status == LoginStatus.SUCCESS),
+                message=message,
+                response_time=response_time,
+                url=url,
+                final_url=final_url,
+                page_changed=None,
+                details={
+                    'url_changed': url_changed,
+                    'status_code': status_code,
+                    'content_length': len(content)
+                }
+            )
+            
+        except Exception as e:
+            return self._error_result(e, url, start_time)
+    
+    async def _submit_login(
+        self,
+        session: aiohttp.ClientSession,
+        form_info: FormInfo,
+        username: str,
+        password: str,
+        captcha: str = ""
+    ) -> Tuple[str, str, int]:
+        """按表单信息构建登录数据并发送登录请求"""
+        login_data = form_info.hidden_fields.copy()
+        login_data[form_info.username_field] = username
+        login_data[form_info.password_field] = password
         
-        # 情况5: 只有页面变化，无法确定
-        if page_changed:
-            return LoginStatus.SUCCESS, "可能登录成功: 页面发生变化，请人工确认"
+        if form_info.captcha_field and captcha:
+            login_data[form_info.captcha_field] = captcha
         
-        return LoginStatus.UNKNOWN_ERROR, "无法确定登录状态，请人工确认"
+        if form_info.method == 'POST':
+            return await self._fetch(session, 'POST', form_info.action, data=login_data)
+        return await self._fetch(session, 'GET', form_info.action, params=login_data)
     
-    def close(self):
-        """关闭会话"""
-        self.session.close()
+    async def verify_batch(
+        self,
+        targets: List[Tuple[str, str, str]],
+        captcha: str = ""
+    ) -> List[LoginResult]:
+        """
+        并发验证多个目标，并发度由连接池上限控制
+        
+        每个目标使用独立的会话（共享连接池），并发目标之间不共享Cookie，
+        因此同一主机上的多个目标不会互相覆盖会话与CSRF令牌。
+        
+        Args:
+            targets: (URL, 用户名, 密码) 列表
+            captcha: 验证码（可选）
+            
+        Returns:
+            与targets顺序一致的LoginResult列表
+        """
+        self._require_session()
+        
+        async def verify_one(url: str, username: str, password: str) -> LoginResult:
+            async with self._new_session() as session:
+                return await self._verify_login(session, url, username, password, captcha)
+        
+        return await asyncio.gather(*(
+            verify_one(url, username, password)
+            for url, username, password in targets
+        ))
+
+
+def _build_keyword_automaton():
+    """将所有关键词编译为一个Aho-Corasick自动机，值为(分类, 原关键词)元组"""
+    entries: Dict[str, List[Tuple[str, str]]] = {}
+    for category, keywords in _LoginVerifierBase._KEYWORD_GROUPS:
+        for keyword in keywords:
+            entries.setdefault(keyword, []).append((category, keyword))
     
-    def __enter__(self):
-        return self
+    automaton = ahocorasick.Automaton()
+    for key, value in entries.items():
+        automaton.add_word(key, tuple(value))
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_keyword_patterns():
+    """
+    构建逐关键词匹配表 {分类: ((关键词, 正则或None), ...)}
     
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.close()
+    区分大小写的关键词预编译为忽略大小写的正则；中文等无大小写的关键词直接做子串查找。
+    """
+    patterns = {}
+    for category, keywords in _LoginVerifierBase._KEYWORD_GROUPS:
+        patterns[category] = tuple(
+            (keyword, None) if keyword == keyword.upper()
+            else (keyword, re.compile(re.escape(keyword), re.IGNORECASE))
+            for keyword in keywords
+        )
+    return patterns
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton() if AHOCORASICK_AVAILABLE else None
+_KEYWORD_PATTERNS = _build_keyword_patterns()
 
 
 def quick_verify(url: str, username: str, password: str, captcha: str = "") -> LoginResult:
@@ -6,15 +6,290 @@
 """
 
 import json
+import mmap
+import os
 import pickle
+import queue
+import threading
+import time
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass, field, asdict
+from array import array
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+from dataclasses import InitVar, dataclass, field, asdict
 from datetime import datetime
-import hashlib
+from enum import Enum
+import secrets
+import sys
 
 from .async_verifier import TargetInfo, LoginResult, LoginStatus
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+def _dumps_json(obj: Any, indent: bool = True) -> bytes:
+    """序列化为UTF-8编码的JSON，优先使用orjson"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+def _loads_json(content: bytes) -> Any:
+    """解析JSON，优先使用orjson"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+# 最近一次格式化的时间 (整秒时间戳, 字符串)
+_now_cache: Tuple[int, str] = (0, "")
+
+
+def _now_str() -> str:
+    """当前时间字符串，同一秒内复用格式化结果"""
+    global _now_cache
+    sec = int(time.time())
+    cached_sec, text = _now_cache
+    if sec != cached_sec:
+        text = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+        _now_cache = (sec, text)
+    return text
+
+
+class CheckpointMode(Enum):
+    """检查点写入模式"""
+    EAGER = "eager"             # 每条结果立即写入
+    BATCHED = "batched"         # 累积一定数量或间隔一定时间后写入
+    OPTIMISTIC = "optimistic"   # 仅在flush/close时写入
+
+
+# 状态枚举 <-> 紧凑编码（按列存储结果时使用）
+_STATUSES: Tuple[LoginStatus, ...] = tuple(LoginStatus)
+_STATUS_CODES: Dict[LoginStatus, int] = {status: code for code, status in enumerate(_STATUSES)}
+_STATUS_MAP: Dict[str, LoginStatus] = {status.value: status for status in _STATUSES}
+_UNKNOWN_CODE = _STATUS_CODES[LoginStatus.UNKNOWN_ERROR]
+
+# 计入错误统计的状态
+_ERROR_CODES = frozenset(
+    _STATUS_CODES[status]
+    for status in (LoginStatus.CONNECTION_ERROR, LoginStatus.TIMEOUT_ERROR, LoginStatus.UNKNOWN_ERROR)
+)
+
+if NUMPY_AVAILABLE:
+    _ERROR_CODE_ARRAY = np.array(sorted(_ERROR_CODES), dtype=np.uint8)
+
+# pickle会话快照（需显式启用）使用的协议（5支持直接写出缓冲区）
+_PICKLE_PROTOCOL = 5
+
+# page_changed列的编码
+_PAGE_CHANGED_CODES = {False: 0, True: 1, None: 2}
+_PAGE_CHANGED_VALUES = (False, True, None)
+
+
+def _classify(success: bool, status_code: int) -> Tuple[bool, bool, bool]:
+    """结果分类 (是否成功, 是否失败, 是否错误)"""
+    return (
+        success,
+        not success and status_code != _UNKNOWN_CODE,
+        status_code in _ERROR_CODES
+    )
+
+
+def _result_to_dict(index: Optional[int], result: LoginResult) -> Dict[str, Any]:
+    """结果转换为可序列化字典"""
+    return {
+        'status': result.status.value,
+        'success': result.success,
+        'message': result.message,
+        'response_time': result.response_time,
+        'url': result.url,
+        'final_url': result.final_url,
+        'page_changed': result.page_changed,
+        'details': result.details,
+        'timestamp': result.timestamp,
+        'target_index': index
+    }
+
+
+def _result_from_dict(r_data: Dict[str, Any]) -> LoginResult:
+    """从字典创建结果"""
+    return LoginResult(
+        status=_STATUS_MAP[r_data['status']],
+        success=r_data['success'],
+        message=r_data['message'],
+        response_time=r_data['response_time'],
+        url=r_data['url'],
+        final_url=r_data['final_url'],
+        page_changed=r_data['page_changed'],
+        details=r_data.get('details'),
+        timestamp=r_data.get('timestamp')
+    )
+
+
+class _ResultColumns:
+    """
+    按列存储的扫描结果
+    
+    每个字段一列，数值字段使用紧凑数组，不为每条结果保留LoginResult对象；
+    需要时再按行生成LoginResult。
+    """
+    
+    def __init__(self):
+        self.rows: Dict[int, int] = {}              # 目标索引 -> 行号
+        self.indices = array('q')
+        self.statuses = array('B')
+        self.success = bytearray()
+        self.page_changed = bytearray()
+        self.response_times = array('d')
+        self.urls: List[str] = []
+        self.final_urls: List[str] = []
+        self.messages: List[str] = []
+        self.details: List[Optional[Dict[str, Any]]] = []
+        self.timestamps: List[str] = []
+    
+    def __len__(self) -> int:
+        return len(self.indices)
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # 行号映射由indices重建；数值列以PickleBuffer直接写出，不再复制一份bytes
+        return {
+            'byteorder': sys.byteorder,
+            'status_values': [status.value for status in _STATUSES],
+            'indices': pickle.PickleBuffer(self.indices),
+            'statuses': pickle.PickleBuffer(self.statuses),
+            'success': self.success,
+            'page_changed': self.page_changed,
+            'response_times': pickle.PickleBuffer(self.response_times),
+            'urls': self.urls,
+            'final_urls': self.final_urls,
+            'messages': self.messages,
+            'details': self.details,
+            'timestamps': self.timestamps
+        }
+    
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__init__()
+        self.indices.frombytes(state['indices'])
+        self.statuses.frombytes(state['statuses'])
+        self.response_times.frombytes(state['response_times'])
+        if state['byteorder'] != sys.byteorder:
+            self.indices.byteswap()
+            self.response_times.byteswap()
+        
+        # 状态枚举有增删或调整顺序时按枚举值重新编码
+        status_values = state['status_values']
+        if status_values != [status.value for status in _STATUSES]:
+            remap = [
+                _STATUS_CODES[_STATUS_MAP[value]] if value in _STATUS_MAP else _UNKNOWN_CODE
+                for value in status_values
+            ]
+            self.statuses = array('B', [remap[code] for code in self.statuses])
+        
+        self.success = state['success']
+        self.page_changed = state['page_changed']
+        self.urls = state['urls']
+        self.final_urls = state['final_urls']
+        self.messages = state['messages']
+        self.details = state['details']
+        self.timestamps = state['timestamps']
+        self.rows = {index: row for row, index in enumerate(self.indices)}
+    
+    def put(self, index: int, result: LoginResult) -> int:
+        """写入结果（目标索引已存在时覆盖该行），返回行号"""
+        status = _STATUS_CODES[result.status]
+        success = 1 if result.success else 0
+        page_changed = _PAGE_CHANGED_CODES[result.page_changed]
+        
+        row = self.rows.get(index)
+        if row is None:
+            row = self.rows[index] = len(self.indices)
+            self.indices.append(index)
+            self.statuses.append(status)
+            self.success.append(success)
+            self.page_changed.append(page_changed)
+            self.response_times.append(result.response_time)
+            self.urls.append(result.url)
+            self.final_urls.append(result.final_url)
+            self.messages.append(result.message)
+            self.details.append(result.details)
+            self.timestamps.append(result.timestamp)
+        else:
+            self.statuses[row] = status
+            self.success[row] = success
+            self.page_changed[row] = page_changed
+            self.response_times[row] = result.response_time
+            self.urls[row] = result.url
+            self.final_urls[row] = result.final_url
+            self.messages[row] = result.message
+            self.details[row] = result.details
+            self.timestamps[row] = result.timestamp
+        return row
+    
+    def classify(self, row: int) -> Tuple[bool, bool, bool]:
+        """按行分类结果"""
+        return _classify(bool(self.success[row]), self.statuses[row])
+    
+    def get(self, row: int) -> LoginResult:
+        """生成该行的LoginResult"""
+        return LoginResult(
+            status=_STATUSES[self.statuses[row]],
+            success=bool(self.success[row]),
+            message=self.messages[row],
+            response_time=self.response_times[row],
+            url=self.urls[row],
+            final_url=self.final_urls[row],
+            page_changed=_PAGE_CHANGED_VALUES[self.page_changed[row]],
+            details=self.details[row],
+            timestamp=self.timestamps[row]
+        )
+    
+    def row_dict(self, row: int) -> Dict[str, Any]:
+        """该行的可序列化字典（与_result_to_dict格式一致）"""
+        return {
+            'status': _STATUSES[self.statuses[row]].value,
+            'success': bool(self.success[row]),
+            'message': self.messages[row],
+            'response_time': self.response_times[row],
+            'url': self.urls[row],
+            'final_url': self.final_urls[row],
+            'page_changed': _PAGE_CHANGED_VALUES[self.page_changed[row]],
+            'details': self.details[row],
+            'timestamp': self.timestamps[row],
+            'target_index': self.indices[row]
+        }
+    
+    def count(self) -> Tuple[int, int, int]:
+        """统计 (成功, 失败, 错误) 数量"""
+        if not len(self):
+            return 0, 0, 0
+        
+        if NUMPY_AVAILABLE:
+            # 直接在列缓冲区上向量化统计（零拷贝）
+            statuses = np.frombuffer(self.statuses, dtype=np.uint8)
+            success_flags = np.frombuffer(self.success, dtype=np.uint8)
+            success = int(np.count_nonzero(success_flags))
+            errors = int(np.count_nonzero(np.isin(statuses, _ERROR_CODE_ARRAY)))
+            unknown_failed = int(np.count_nonzero((statuses == _UNKNOWN_CODE) & (success_flags == 0)))
+            return success, len(self) - success - unknown_failed, errors
+        
+        success = self.success.count(1)
+        errors = sum(self.statuses.count(code) for code in _ERROR_CODES)
+        unknown_failed = sum(
+            1 for status, ok in zip(self.statuses, self.success)
+            if status == _UNKNOWN_CODE and not ok
+        )
+        return success, len(self) - success - unknown_failed, errors
+
 
 @dataclass
 class ScanSession:
@@ -24,27 +299,55 @@ class ScanSession:
     updated_at: str
     targets: List[TargetInfo]
     completed_indices: List[int] = field(default_factory=list)
-    results: List[LoginResult] = field(default_factory=list)
     config: Dict[str, Any] = field(default_factory=dict)
     stats: Dict[str, int] = field(default_factory=dict)
+    # 初始结果：目标索引 -> 结果（按首次完成顺序），创建后按列存储
+    initial_results: InitVar[Optional[Dict[int, LoginResult]]] = None
     
-    def __post_init__(self):
+    def __post_init__(self, initial_results: Optional[Dict[int, LoginResult]]):
         if not self.session_id:
             self.session_id = self._generate_session_id()
         if not self.created_at:
             self.created_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         if not self.updated_at:
             self.updated_at = self.created_at
+        
+        # 已完成索引集合，completed_indices保留完成顺序用于序列化
+        self._completed = set(self.completed_indices)
+        
+        self._results = _ResultColumns()
+        for index, result in (initial_results or {}).items():
+            self._results.put(index, result)
+        
+        # 增量维护的统计计数 [成功, 失败, 错误]
+        self._stat_counters = list(self._results.count())
+        self._update_stats()
+    
+    @property
+    def results(self) -> Tuple[LoginResult, ...]:
+        """全部结果（按首次完成顺序，只读；添加结果请使用add_result）"""
+        return tuple(self._results.get(row) for row in range(len(self._results)))
+    
+    def iter_results(self) -> Iterator[Tuple[int, LoginResult]]:
+        """按首次完成顺序遍历 (目标索引, 结果)"""
+        results = self._results
+        for row in range(len(results)):
+            yield results.indices[row], results.get(row)
+    
+    def get_result(self, index: int) -> Optional[LoginResult]:
+        """获取指定目标的结果"""
+        row = self._results.rows.get(index)
+        return None if row is None else self._results.get(row)
     
     def _generate_session_id(self) -> str:
         """生成会话ID"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        random_str = hashlib.md5(str(datetime.now().timestamp()).encode()).hexdigest()[:8]
+        random_str = secrets.token_hex(4)
         return f"scan_{timestamp}_{random_str}"
     
     def get_progress(self) -> Tuple[int, int]:
         """获取进度 (已完成, 总数)"""
-        return len(self.completed_indices), len(self.targets)
+        return len(self._completed), len(self.targets)
     
     def get_completion_rate(self) -> float:
         """获取完成率 (0-1)"""
@@ -58,65 +361,66 @@ class ScanSession:
     
     def get_remaining_targets(self) -> List[TargetInfo]:
         """获取剩余目标"""
-        return [t for i, t in enumerate(self.targets) if i not in self.completed_indices]
+        completed = self._completed
+        return [t for i, t in enumerate(self.targets) if i not in completed]
     
     def add_result(self, index: int, result: LoginResult):
         """添加结果"""
-        if index not in self.completed_indices:
+        self._replay_result(index, result)
+        self.updated_at = _now_str()
+    
+    def _replay_result(self, index: int, result: LoginResult):
+        """记录结果但不修改更新时间（加载时重放已保存的结果）"""
+        if index not in self._completed:
+            self._completed.add(index)
             self.completed_indices.append(index)
         
-        # 替换或添加结果
-        for i, r in enumerate(self.results):
-            if hasattr(r, 'target') and hasattr(r.target, 'index') and r.target.index == index:
-                self.results[i] = result
-                break
-        else:
-            self.results.append(result)
-        
-        # 更新时间
-        self.updated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # 替换或添加结果（替换时先扣除旧结果的计数）
+        old_row = self._results.rows.get(index)
+        if old_row is not None:
+            self._count_row(old_row, -1)
+        self._count_row(self._results.put(index, result), 1)
         
         # 更新统计
         self._update_stats()
     
+    def _count_row(self, row: int, delta: int):
+        """按结果分类调整统计计数"""
+        counters = self._stat_counters
+        for i, hit in enumerate(self._results.classify(row)):
+            if hit:
+                counters[i] += delta
+    
     def _update_stats(self):
         """更新统计信息"""
+        success, failed, errors = self._stat_counters
         self.stats = {
             'total': len(self.targets),
-            'completed': len(self.completed_indices),
-            'remaining': len(self.targets) - len(self.completed_indices),
-            'success': sum(1 for r in self.results if r.success),
-            'failed': sum(1 for r in self.results if not r.success and r.status != LoginStatus.UNKNOWN_ERROR),
-            'errors': sum(1 for r in self.results if r.status in [LoginStatus.CONNECTION_ERROR, LoginStatus.TIMEOUT_ERROR, LoginStatus.UNKNOWN_ERROR])
+            'completed': len(self._completed),
+            'remaining': len(self.targets) - len(self._completed),
+            'success': success,
+            'failed': failed,
+            'errors': errors
         }
     
-    def to_dict(self) -> Dict[str, Any]:
-        """转换为字典"""
+    def header_dict(self) -> Dict[str, Any]:
+        """会话头信息（不含结果）"""
         return {
             'session_id': self.session_id,
             'created_at': self.created_at,
             'updated_at': self.updated_at,
-            'targets': [t.to_dict() for t in self.targets],
-            'completed_indices': self.completed_indices,
-            'results': [
-                {
-                    'status': r.status.value,
-                    'success': r.success,
-                    'message': r.message,
-                    'response_time': r.response_time,
-                    'url': r.url,
-                    'final_url': r.final_url,
-                    'page_changed': r.page_changed,
-                    'details': r.details,
-                    'timestamp': r.timestamp,
-                    'target_index': r.details.get('target_index') if r.details else None
-                }
-                for r in self.results
-            ],
-            'config': self.config,
-            'stats': self.stats
+            'targets': [asdict(t) for t in self.targets],
+            'config': self.config
         }
     
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典"""
+        data = self.header_dict()
+        data['completed_indices'] = self.completed_indices
+        data['results'] = [self._results.row_dict(row) for row in range(len(self._results))]
+        data['stats'] = self.stats
+        return data
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ScanSession':
         """从字典创建"""
@@ -127,51 +431,171 @@ class ScanSession:
                 username=t_data['username'],
                 password=t_data['password'],
                 extra=t_data.get('extra'),
-                index=t_data.get('index', 0),
-                source_file=t_data.get('source_file')
+                index=t_data.get('index', 0)
             ))
         
-        results = []
-        for r_data in data.get('results', []):
-            results.append(LoginResult(
-                status=LoginStatus(r_data['status']),
-                success=r_data['success'],
-                message=r_data['message'],
-                response_time=r_data['response_time'],
-                url=r_data['url'],
-                final_url=r_data['final_url'],
-                page_changed=r_data['page_changed'],
-                details=r_data.get('details'),
-                timestamp=r_data.get('timestamp')
-            ))
+        # 结果中记录了目标索引时以其为准，旧格式按completed_indices顺序对应
+        completed_indices = data.get('completed_indices', [])
+        initial_results = {}
+        for pos, r_data in enumerate(data.get('results', [])):
+            index = r_data.get('target_index')
+            if index is None:
+                index = completed_indices[pos] if pos < len(completed_indices) else -(pos + 1)
+            initial_results[index] = _result_from_dict(r_data)
         
         session = cls(
             session_id=data.get('session_id'),
             created_at=data.get('created_at'),
             updated_at=data.get('updated_at'),
             targets=targets,
-            completed_indices=data.get('completed_indices', []),
-            results=results,
+            completed_indices=completed_indices,
             config=data.get('config', {}),
-            stats=data.get('stats', {})
+            stats=data.get('stats', {}),
+            initial_results=initial_results
         )
         
         return session
+    
+    def __reduce__(self):
+        # 只保存会话数据，已完成集合与统计计数在加载时重建
+        return _restore_session, ({
+            'session_id': self.session_id,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'targets': self.targets,
+            'completed_indices': self.completed_indices,
+            'config': self.config,
+            'results': self._results
+        },)
+
+
+def _restore_session(state: Dict[str, Any]) -> ScanSession:
+    """从pickle状态恢复会话"""
+    session = ScanSession(
+        session_id=state['session_id'],
+        created_at=state['created_at'],
+        updated_at=state['updated_at'],
+        targets=state['targets'],
+        completed_indices=state['completed_indices'],
+        config=state['config']
+    )
+    session._results = state['results']
+    session._stat_counters = list(session._results.count())
+    session._update_stats()
+    return session
 
 
 class ProgressManager:
     """进度管理器"""
     
-    def __init__(self, save_dir: str = "sessions"):
+    def __init__(
+        self,
+        save_dir: str = "sessions",
+        checkpoint_mode: CheckpointMode = CheckpointMode.EAGER,
+        batch_size: int = 100,
+        batch_interval: float = 5.0,
+        background_writer: bool = False,
+        durable: bool = False,
+        pickle_snapshots: bool = False
+    ):
         """
         初始化进度管理器
         
         Args:
             save_dir: 保存目录
+            checkpoint_mode: 检查点写入模式（record_result使用）
+            batch_size: 批量模式下累积多少条结果写入一次
+            batch_interval: 批量模式下最长写入间隔（秒）
+            background_writer: 在后台线程写入文件，调用方只负责序列化，无需等待磁盘
+            durable: 替换快照后同步目录项，断电后也不会丢失最近一次快照
+            pickle_snapshots: 以pickle保存和加载会话快照，大会话读写更快；但加载pickle文件
+                可执行任意代码，且文件格式依赖当前类结构，只应用于自己生成的会话。
+                默认使用JSON快照，不会加载pickle文件
         """
         self.save_dir = Path(save_dir)
         self.save_dir.mkdir(exist_ok=True)
         self.current_session: Optional[ScanSession] = None
+        self.durable = durable
+        self.pickle_snapshots = pickle_snapshots
+        
+        # 已确认磁盘上有快照或头文件的会话ID，追加结果时无需再写头文件
+        self._headers_written = set()
+        
+        # 清理上次写入中断留下的临时文件
+        for pattern in ("*.pkl.tmp", "*.json.tmp"):
+            for tmp_path in self.save_dir.glob(pattern):
+                try:
+                    tmp_path.unlink()
+                except OSError:
+                    pass
+        
+        self.checkpoint_mode = checkpoint_mode
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        
+        # 尚未写入的结果及其所属会话
+        self._pending: List[Tuple[int, LoginResult]] = []
+        self._pending_session: Optional[ScanSession] = None
+        self._last_flush = time.monotonic()
+        
+        # 后台写入：任务按提交顺序执行，最多积压2个（写盘的同时可准备下一个）
+        self._write_queue: Optional[queue.Queue] = None
+        self._writer_thread: Optional[threading.Thread] = None
+        if background_writer:
+            self._write_queue = queue.Queue(maxsize=2)
+            self._writer_thread = threading.Thread(
+                target=self._writer_loop, args=(self._write_queue,), daemon=True
+            )
+            self._writer_thread.start()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def close(self):
+        """写入所有未保存的结果并停止后台写入线程"""
+        self.flush()
+        
+        if self._writer_thread is not None:
+            self._write_queue.put(None)
+            self._writer_thread.join()
+            self._writer_thread = None
+            self._write_queue = None
+    
+    def _writer_loop(self, write_queue: queue.Queue):
+        """后台写入线程"""
+        while True:
+            job = write_queue.get()
+            try:
+                if job is None:
+                    return
+                error_message, write, args = job
+                try:
+                    write(*args)
+                except Exception as e:
+                    print(f"{error_message}: {e}")
+            finally:
+                write_queue.task_done()
+    
+    def _submit_write(self, error_message: str, write, *args) -> bool:
+        """执行写入任务；启用后台写入时交给写入线程"""
+        if self._write_queue is not None:
+            self._write_queue.put((error_message, write, args))
+            return True
+        
+        try:
+            write(*args)
+            return True
+        except Exception as e:
+            print(f"{error_message}: {e}")
+            return False
+    
+    def _wait_for_writes(self):
+        """等待已提交的后台写入完成"""
+        if self._write_queue is not None:
+            self._write_queue.join()
     
     def create_session(
         self,
@@ -189,6 +613,9 @@ class ProgressManager:
             ScanSession对象
         """
         session = ScanSession(
+            session_id="",
+            created_at="",
+            updated_at="",
             targets=targets,
             config=config or {}
         )
@@ -205,28 +632,171 @@ class ProgressManager:
         Returns:
             ScanSession对象或None
         """
-        filepath = self.save_dir / f"{session_id}.json"
-        
-        if not filepath.exists():
-            return None
+        self._wait_for_writes()
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            session = ScanSession.from_dict(data)
-            self.current_session = session
+            session = self._read_session(session_id)
+            if session:
+                self.current_session = session
             return session
             
         except Exception as e:
             print(f"加载会话失败: {e}")
             return None
     
-    def save_session(self, session: Optional[ScanSession] = None) -> bool:
+    def _session_file(self, session_id: str, suffix: str) -> Path:
+        """会话文件路径；会话ID只能是文件名，保证只读写会话目录内的文件"""
+        if (not session_id or session_id in ('.', '..')
+                or '/' in session_id or '\\' in session_id):
+            raise ValueError(f"无效的会话ID: {session_id!r}")
+        return self.save_dir / f"{session_id}{suffix}"
+    
+    def _json_path(self, session_id: str) -> Path:
+        """JSON会话快照路径（默认格式；首次追加结果时写入的会话头也保存在这里）"""
+        return self._session_file(session_id, ".json")
+    
+    def _pickle_path(self, session_id: str) -> Path:
+        """pickle会话快照路径（仅pickle_snapshots启用时读写）"""
+        return self._session_file(session_id, ".pkl")
+    
+    def _results_path(self, session_id: str) -> Path:
+        """增量结果文件路径（每行一条JSON）"""
+        return self._session_file(session_id, ".results.ndjson")
+    
+    def _meta_path(self, session_id: str) -> Path:
+        """会话摘要文件路径（供list_sessions快速读取）"""
+        return self._session_file(session_id, ".meta.json")
+    
+    def _session_file_paths(self, session_id: str) -> Tuple[Path, ...]:
+        """会话的全部文件"""
+        return (
+            self._json_path(session_id),
+            self._pickle_path(session_id),
+            self._results_path(session_id),
+            self._meta_path(session_id)
+        )
+    
+    def _scan_sessions(self) -> Dict[str, Tuple[os.DirEntry, Optional[os.DirEntry]]]:
         """
-        保存会话
+        遍历一次会话目录
+        
+        Returns:
+            会话ID -> (快照, 增量结果文件)，同一会话同时有两种快照时优先使用当前格式
+        """
+        pickled = {}
+        json_snapshots = {}
+        results = {}
+        with os.scandir(self.save_dir) as it:
+            for entry in it:
+                name = entry.name
+                if name.endswith('.pkl'):
+                    pickled[name[:-4]] = entry
+                elif name.endswith('.results.ndjson'):
+                    results[name[:-15]] = entry
+                elif name.endswith('.json') and not name.endswith('.meta.json'):
+                    json_snapshots[name[:-5]] = entry
+        
+        if self.pickle_snapshots:
+            snapshots = {**json_snapshots, **pickled}
+        else:
+            snapshots = {**pickled, **json_snapshots}
+        return {session_id: (entry, results.get(session_id)) for session_id, entry in snapshots.items()}
+    
+    def _session_meta(self, session: ScanSession) -> Dict[str, Any]:
+        """会话摘要"""
+        completed, total = session.get_progress()
+        return {
+            'session_id': session.session_id,
+            'created_at': session.created_at,
+            'updated_at': session.updated_at,
+            'total_targets': total,
+            'completed_targets': completed,
+            'stats': dict(session.stats)
+        }
+    
+    def _load_meta_file(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """读取会话摘要文件，缺失或损坏时返回None"""
+        try:
+            with open(self._meta_path(session_id), 'rb') as f:
+                return _loads_json(f.read())
+        except (FileNotFoundError, ValueError):
+            return None
+    
+    def _read_meta(self, session_id: str) -> Dict[str, Any]:
+        """读取会话摘要，缺失或损坏时从完整会话重建"""
+        meta = self._load_meta_file(session_id)
+        if meta is not None:
+            return meta
+        
+        meta = self._session_meta(self._read_session(session_id))
+        self._write_file(self._meta_path(session_id), _dumps_json(meta, indent=False))
+        return meta
+    
+    def _read_session(self, session_id: str) -> Optional[ScanSession]:
+        """读取会话快照并重放增量结果"""
+        json_path = self._json_path(session_id)
+        pickle_path = self._pickle_path(session_id)
+        
+        if self.pickle_snapshots and pickle_path.exists():
+            # 加载pickle会执行文件中的任意代码，只在显式启用时读取会话目录内的文件
+            with open(pickle_path, 'rb') as f:
+                session = pickle.loads(f.read())
+            if not isinstance(session, ScanSession):
+                raise ValueError(f"无效的会话文件: {pickle_path.name}")
+        elif json_path.exists():
+            with open(json_path, 'rb') as f:
+                session = ScanSession.from_dict(_loads_json(f.read()))
+        elif pickle_path.exists():
+            raise ValueError(f"{pickle_path.name} 是pickle快照，需启用pickle_snapshots才能加载")
+        else:
+            return None
+        
+        # 重放不修改更新时间；快照之后追加过结果时，最后一次追加的时间记录在摘要文件中
+        replayed = False
+        for record in self._iter_appended_results(session_id):
+            session._replay_result(record['target_index'], _result_from_dict(record))
+            replayed = True
+        if replayed:
+            meta = self._load_meta_file(session_id)
+            updated_at = meta.get('updated_at') if isinstance(meta, dict) else None
+            if isinstance(updated_at, str) and updated_at > session.updated_at:
+                session.updated_at = updated_at
+        return session
+    
+    def _iter_appended_results(self, session_id: str) -> Iterator[Dict[str, Any]]:
+        """逐条读取增量结果文件（内存映射，不复制整个文件）"""
+        try:
+            f = open(self._results_path(session_id), 'rb')
+        except FileNotFoundError:
+            return
+        
+        with f:
+            # 空文件无法映射
+            if not os.fstat(f.fileno()).st_size:
+                return
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for line in iter(mm.readline, b''):
+                    try:
+                        yield _loads_json(line)
+                    except ValueError:
+                        # 写入中断导致的残缺行
+                        continue
+    
+    def append_result(
+        self,
+        index: int,
+        result: LoginResult,
+        session: Optional[ScanSession] = None
+    ) -> bool:
+        """
+        记录一条结果并追加到增量结果文件
+        
+        每次只写入一行，代价与会话大小无关；快照由save_session/compact_session重写。
         
         Args:
+            index: 目标索引
+            result: 验证结果
             session: 会话对象（默认使用当前会话）
             
         Returns:
@@ -237,17 +807,174 @@ class ProgressManager:
         if not session:
             return False
         
-        try:
-            filepath = self.save_dir / f"{session.session_id}.json"
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(session.to_dict(), f, indent=2, ensure_ascii=False)
+        session.add_result(index, result)
+        return self._append_records(session, [(index, result)])
+    
+    def record_result(
+        self,
+        index: int,
+        result: LoginResult,
+        session: Optional[ScanSession] = None
+    ) -> bool:
+        """
+        记录一条结果，按检查点模式决定何时写入
+        
+        Args:
+            index: 目标索引
+            result: 验证结果
+            session: 会话对象（默认使用当前会话）
             
+        Returns:
+            是否成功（未到写入时机时返回True）
+        """
+        session = session or self.current_session
+        
+        if not session:
+            return False
+        
+        if self._pending_session is not session:
+            self.flush()
+            self._pending_session = session
+        
+        session.add_result(index, result)
+        self._pending.append((index, result))
+        
+        if self.checkpoint_mode == CheckpointMode.EAGER:
+            return self.flush()
+        if self.checkpoint_mode == CheckpointMode.BATCHED and (
+            len(self._pending) >= self.batch_size
+            or time.monotonic() - self._last_flush >= self.batch_interval
+        ):
+            return self.flush()
+        return True
+    
+    def flush(self) -> bool:
+        """将累积的结果一次性写入增量结果文件"""
+        self._last_flush = time.monotonic()
+        
+        if not self._pending:
             return True
+        
+        records, self._pending = self._pending, []
+        return self._append_records(self._pending_session, records)
+    
+    def _append_records(self, session: ScanSession, records: List[Tuple[int, LoginResult]]) -> bool:
+        """追加多条结果到增量结果文件（一次写入）"""
+        session_id = session.session_id
+        try:
+            data = b''.join(
+                _dumps_json(_result_to_dict(index, result), indent=False) + b'\n'
+                for index, result in records
+            )
+            meta = _dumps_json(self._session_meta(session), indent=False)
+            # 首次追加时附带会话头（目标与配置），保存快照前会话也能被列出和恢复
+            header = None
+            if session_id not in self._headers_written:
+                header = _dumps_json(session.header_dict(), indent=False)
+        except Exception as e:
+            print(f"追加结果失败: {e}")
+            return False
+        
+        self._headers_written.add(session_id)
+        return self._submit_write("追加结果失败", self._write_append, session_id, data, meta, header)
+    
+    def _write_append(self, session_id: str, data: bytes, meta: bytes, header: Optional[bytes] = None):
+        """追加已序列化的结果并更新摘要；会话还没有快照时先写入头文件"""
+        json_path = self._json_path(session_id)
+        if header is not None and not (json_path.exists() or self._pickle_path(session_id).exists()):
+            # 头文件即不含结果的JSON快照，按快照方式读取后重放增量结果
+            self._write_atomic(json_path, header)
+        
+        with open(self._results_path(session_id), 'ab', buffering=1 << 16) as f:
+            f.write(data)
+        self._write_file(self._meta_path(session_id), meta)
+    
+    def _write_snapshot(self, session_id: str, data: bytes, meta: bytes, pickled: bool):
+        """写入已序列化的快照，删除已合并的增量结果并更新摘要"""
+        json_path = self._json_path(session_id)
+        pickle_path = self._pickle_path(session_id)
+        self._write_atomic(pickle_path if pickled else json_path, data)
+        
+        # 另一种格式的快照（或头文件）已被取代
+        stale_path = json_path if pickled else pickle_path
+        if stale_path.exists():
+            stale_path.unlink()
+        
+        # 快照已包含全部结果，增量文件可以删除（重放时按索引替换，残留也不会重复计数）
+        results_path = self._results_path(session_id)
+        if results_path.exists():
+            results_path.unlink()
+        
+        self._write_file(self._meta_path(session_id), meta)
+    
+    def _write_atomic(self, filepath: Path, data: bytes):
+        """先完整写入临时文件并落盘，再原子替换，写入中断时旧文件仍然完好"""
+        tmp_path = filepath.with_name(filepath.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
+        
+        if self.durable and os.name != 'nt':
+            dir_fd = os.open(self.save_dir, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+    
+    def _write_file(self, path: Path, data: bytes):
+        """写入小文件"""
+        with open(path, 'wb') as f:
+            f.write(data)
+    
+    def compact_session(self, session: Optional[ScanSession] = None) -> bool:
+        """
+        压缩会话：将全部结果写入快照并清空增量结果文件
+        
+        Args:
+            session: 会话对象（默认使用当前会话）
             
+        Returns:
+            是否成功
+        """
+        session = session or self.current_session
+        
+        if not session:
+            return False
+        
+        # 快照会包含该会话全部结果，未写入的增量无需再追加
+        if self._pending_session is session:
+            self._pending = []
+        
+        # 在调用方线程序列化，得到与当前状态一致的快照
+        pickled = self.pickle_snapshots
+        try:
+            if pickled:
+                data = pickle.dumps(session, protocol=_PICKLE_PROTOCOL)
+            else:
+                data = _dumps_json(session.to_dict(), indent=False)
+            meta = _dumps_json(self._session_meta(session), indent=False)
         except Exception as e:
             print(f"保存会话失败: {e}")
             return False
+        
+        self._headers_written.add(session.session_id)
+        return self._submit_write(
+            "保存会话失败", self._write_snapshot, session.session_id, data, meta, pickled
+        )
+    
+    def save_session(self, session: Optional[ScanSession] = None) -> bool:
+        """
+        保存会话
+        
+        Args:
+            session: 会话对象（默认使用当前会话）
+            
+        Returns:
+            是否成功
+        """
+        return self.compact_session(session)
     
     def delete_session(self, session_id: str) -> bool:
         """
@@ -259,13 +986,18 @@ class ProgressManager:
         Returns:
             是否成功
         """
-        filepath = self.save_dir / f"{session_id}.json"
+        self._wait_for_writes()
+        
+        paths = self._session_file_paths(session_id)
+        self._headers_written.discard(session_id)
         
-        if not filepath.exists():
+        if not (paths[0].exists() or paths[1].exists()):
             return False
         
         try:
-            filepath.unlink()
+            for path in paths:
+                if path.exists():
+                    path.unlink()
             return True
         except Exception as e:
             print(f"删除会话失败: {e}")
@@ -278,27 +1010,28 @@ class ProgressManager:
         Returns:
             会话信息列表
         """
+        self._wait_for_writes()
+        
         sessions = []
         
-        for filepath in self.save_dir.glob("*.json"):
+        for session_id, (entry, _) in self._scan_sessions().items():
             try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                completed, total = len(data.get('completed_indices', [])), len(data.get('targets', []))
+                # 只读取摘要文件，无需解析完整会话
+                meta = self._read_meta(session_id)
+                completed, total = meta['completed_targets'], meta['total_targets']
                 
                 sessions.append({
-                    'session_id': data.get('session_id'),
-                    'created_at': data.get('created_at'),
-                    'updated_at': data.get('updated_at'),
+                    'session_id': meta['session_id'],
+                    'created_at': meta['created_at'],
+                    'updated_at': meta['updated_at'],
                     'total_targets': total,
                     'completed_targets': completed,
                     'completion_rate': completed / total if total > 0 else 0.0,
-                    'stats': data.get('stats', {})
+                    'stats': meta['stats']
                 })
                 
             except Exception as e:
-                print(f"读取会话 {filepath.name} 失败: {e}")
+                print(f"读取会话 {entry.name} 失败: {e}")
         
         # 按创建时间倒序排列
         sessions.sort(key=lambda x: x['created_at'], reverse=True)
@@ -331,31 +1064,37 @@ class ProgressManager:
             if format == "csv":
                 import csv
                 
-                with open(output_file, 'w', newline='', encoding='utf-8-sig') as f:
+                # 按目标索引取用户名/密码，缺失目标时留空
+                credentials = {i: (t.username, t.password) for i, t in enumerate(session.targets)}
+                no_credentials = ('', '')
+                format_time = '{:.3f}'.format
+                
+                rows = (
+                    (
+                        i + 1,
+                        result.url,
+                        *credentials.get(index, no_credentials),
+                        result.status.value,
+                        result.success,
+                        result.message,
+                        format_time(result.response_time),
+                        result.timestamp
+                    )
+                    for i, (index, result) in enumerate(session.iter_results())
+                )
+                
+                with open(output_file, 'w', newline='', encoding='utf-8-sig', buffering=1 << 20) as f:
                     writer = csv.writer(f)
                     writer.writerow([
                         '序号', 'URL', '用户名', '密码',
                         '状态', '成功', '消息',
                         '响应时间(秒)', '时间戳'
                     ])
-                    
-                    for i, result in enumerate(session.results):
-                        target = session.targets[i] if i < len(session.targets) else None
-                        writer.writerow([
-                            i + 1,
-                            result.url,
-                            target.username if target else '',
-                            target.password if target else '',
-                            result.status.value,
-                            result.success,
-                            result.message,
-                            f"{result.response_time:.3f}",
-                            result.timestamp
-                        ])
+                    writer.writerows(rows)
                 
             elif format == "json":
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(session.to_dict(), f, indent=2, ensure_ascii=False)
+                with open(output_file, 'wb') as f:
+                    f.write(_dumps_json(session.to_dict()))
             
             else:
                 return False
@@ -373,21 +1112,28 @@ class ProgressManager:
         Args:
             max_age_days: 最大保留天数
         """
+        self._wait_for_writes()
+        
         from datetime import timedelta
         
-        cutoff_time = datetime.now() - timedelta(days=max_age_days)
+        cutoff_time = (datetime.now() - timedelta(days=max_age_days)).timestamp()
         
-        for filepath in self.save_dir.glob("*.json"):
+        for session_id, (entry, results_entry) in self._scan_sessions().items():
             try:
-                # 获取文件修改时间
-                mtime = datetime.fromtimestamp(filepath.stat().st_mtime)
+                # 获取文件修改时间（增量结果文件更新时以其为准）
+                mtime = entry.stat().st_mtime
+                if results_entry is not None:
+                    mtime = max(mtime, results_entry.stat().st_mtime)
                 
                 if mtime < cutoff_time:
-                    filepath.unlink()
-                    print(f"已删除旧会话: {filepath.name}")
+                    self._headers_written.discard(session_id)
+                    for path in self._session_file_paths(session_id):
+                        if path.exists():
+                            path.unlink()
+                    print(f"已删除旧会话: {entry.name}")
                     
             except Exception as e:
-                print(f"清理会话 {filepath.name} 失败: {e}")
+                print(f"清理会话 {entry.name} 失败: {e}")
 
 
 # 便捷函数
@@ -5,13 +5,22 @@
 支持HTTP/HTTPS/SOCKS5代理
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Deque, Dict, Any, List, Tuple
 from dataclasses import dataclass, field
+from functools import cached_property
 from enum import Enum
+import heapq
 import random
 import json
+from collections import deque
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class ProxyType(Enum):
     """代理类型"""
@@ -20,9 +29,12 @@ class ProxyType(Enum):
     SOCKS5 = "socks5"
 
 
-@dataclass
+_PROTO_MAP = {t.value: t for t in ProxyType}
+
+
+@dataclass(frozen=True)
 class ProxyInfo:
-    """代理信息"""
+    """代理信息（创建后不可修改，代理URL只格式化一次）"""
     host: str
     port: int
     username: Optional[str] = None
@@ -33,26 +45,22 @@ class ProxyInfo:
         """是否需要认证"""
         return bool(self.username and self.password)
     
-    def to_url(self) -> str:
-        """转换为代理URL"""
+    @cached_property
+    def url(self) -> str:
+        """代理URL"""
         if self.is_authenticated():
             return f"{self.proxy_type.value}://{self.username}:{self.password}@{self.host}:{self.port}"
-        else:
-            return f"{self.proxy_type.value}://{self.host}:{self.port}"
+        return f"{self.proxy_type.value}://{self.host}:{self.port}"
+    
+    def to_url(self) -> str:
+        """转换为代理URL"""
+        return self.url
     
     def to_dict(self) -> Dict[str, str]:
         """转换为代理字典（用于requests/aiohttp）"""
-        url = self.to_url()
-        if self.proxy_type == ProxyType.SOCKS5:
-            return {
-                'http': url,
-                'https': url
-            }
-        else:
-            return {
-                'http': url,
-                'https': url
-            }
+        # 返回新字典：requests会向传入的proxies中补充环境变量代理
+        url = self.url
+        return {'http': url, 'https': url}
 
 
 @dataclass
@@ -64,70 +72,112 @@ class ProxyPool:
     rotation_strategy: str = "round_robin"  # round_robin, random, least_used
     
     def __post_init__(self):
-        # 跟踪每个代理的失败次数
-        self.failures: Dict[int, int] = {}
-        self.current_index: int = 0
+        # 跟踪每个代理的失败次数（按代理索引）
+        self.failures: List[int] = [0] * len(self.proxies)
+        
+        # (主机, 端口) -> 代理索引
+        self._by_endpoint: Dict[Tuple[str, int], int] = {}
+        for idx, proxy in enumerate(self.proxies):
+            self._by_endpoint.setdefault((proxy.host, proxy.port), idx)
+        
+        self._rebuild_available()
+    
+    def _rebuild_available(self):
+        """按当前失败次数重建可用代理队列和最少失败堆"""
+        # 可用代理索引，轮询时旋转队首
+        self._available: Deque[int] = deque(
+            idx for idx, count in enumerate(self.failures) if count < self.max_failures
+        )
+        self._available_for = self.max_failures
+        
+        # (失败次数, 索引) 小顶堆，失败次数变化时压入新条目，过期条目在堆顶时丢弃
+        self._usage_heap: List[Tuple[int, int]] = [(count, idx) for idx, count in enumerate(self.failures)]
+        heapq.heapify(self._usage_heap)
+    
+    def _check_max_failures(self):
+        """max_failures被修改后重新计算可用集合"""
+        if self._available_for != self.max_failures:
+            self._rebuild_available()
+    
+    def _push_usage(self, idx: int):
+        """记录代理失败次数的变化"""
+        heapq.heappush(self._usage_heap, (self.failures[idx], idx))
+        if len(self._usage_heap) > 2 * len(self.proxies) + 64:
+            self._usage_heap = [(count, i) for i, count in enumerate(self.failures)]
+            heapq.heapify(self._usage_heap)
     
     def add_proxy(self, proxy: ProxyInfo):
         """添加代理"""
+        idx = len(self.proxies)
         self.proxies.append(proxy)
-        self.failures[len(self.proxies) - 1] = 0
+        self.failures.append(0)
+        self._by_endpoint.setdefault((proxy.host, proxy.port), idx)
+        self._available.append(idx)
+        self._push_usage(idx)
     
     def get_proxy(self) -> Optional[ProxyInfo]:
         """获取下一个可用代理"""
         if not self.enabled or not self.proxies:
             return None
         
-        # 过滤掉失败的代理
-        available = [
-            (idx, proxy) for idx, proxy in enumerate(self.proxies)
-            if self.failures.get(idx, 0) < self.max_failures
-        ]
+        self._check_max_failures()
         
-        if not available:
+        if not self._available:
             # 所有代理都失败了，重置
             self.reset_failures()
-            available = [(idx, proxy) for idx, proxy in enumerate(self.proxies)]
-        
-        if not available:
-            return None
         
         # 根据策略选择代理
         if self.rotation_strategy == "random":
-            idx, proxy = random.choice(available)
+            idx = random.choice(self._available)
         elif self.rotation_strategy == "least_used":
-            idx, proxy = min(available, key=lambda x: self.failures.get(x[0], 0))
+            idx = self._least_used()
         else:  # round_robin
-            idx, proxy = available[self.current_index % len(available)]
-            self.current_index += 1
+            idx = self._available[0]
+            self._available.rotate(-1)
         
-        return proxy
+        return self.proxies[idx]
+    
+    def _least_used(self) -> int:
+        """失败次数最少的可用代理（相同时取索引最小者）"""
+        heap = self._usage_heap
+        while True:
+            count, idx = heap[0]
+            if count == self.failures[idx] and count < self.max_failures:
+                return idx
+            heapq.heappop(heap)
     
     def mark_failure(self, proxy: ProxyInfo):
         """标记代理失败"""
-        for idx, p in enumerate(self.proxies):
-            if p.host == proxy.host and p.port == proxy.port:
-                self.failures[idx] = self.failures.get(idx, 0) + 1
-                break
+        idx = self._by_endpoint.get((proxy.host, proxy.port))
+        if idx is not None:
+            self._check_max_failures()
+            self.failures[idx] += 1
+            if self.failures[idx] == self.max_failures:
+                self._available.remove(idx)
+            self._push_usage(idx)
     
     def mark_success(self, proxy: ProxyInfo):
         """标记代理成功"""
-        for idx, p in enumerate(self.proxies):
-            if p.host == proxy.host and p.port == proxy.port:
-                self.failures[idx] = 0
-                break
+        idx = self._by_endpoint.get((proxy.host, proxy.port))
+        if idx is not None:
+            self._check_max_failures()
+            if self.failures[idx] >= self.max_failures:
+                self._available.append(idx)
+            self.failures[idx] = 0
+            self._push_usage(idx)
     
     def reset_failures(self):
         """重置失败计数"""
-        self.failures = {idx: 0 for idx in range(len(self.proxies))}
+        self.failures = [0] * len(self.proxies)
+        self._rebuild_available()
     
     def get_stats(self) -> Dict[str, Any]:
         """获取统计信息"""
         return {
             'total_proxies': len(self.proxies),
-            'available_proxies': sum(1 for f in self.failures.values() if f < self.max_failures),
-            'failed_proxies': sum(1 for f in self.failures.values() if f >= self.max_failures),
-            'failures': self.failures.copy()
+            'available_proxies': sum(1 for f in self.failures if f < self.max_failures),
+            'failed_proxies': sum(1 for f in self.failures if f >= self.max_failures),
+            'failures': dict(enumerate(self.failures))
         }
 
 
@@ -149,8 +199,9 @@ class ProxyManager:
             是否成功
         """
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(filepath, 'rb') as f:
+                content = f.read()
+            data = orjson.loads(content) if ORJSON_AVAILABLE else json.loads(content)
             
             self.config_file = Path(filepath)
             
@@ -163,7 +214,8 @@ class ProxyManager:
                 
                 # 加载代理列表
                 for proxy_data in pool_config.get('proxies', []):
-                    proxy_type = ProxyType(proxy_data.get('type', 'http'))
+                    proxy_type = proxy_data.get('type', 'http')
+                    proxy_type = _PROTO_MAP.get(proxy_type) or ProxyType(proxy_type)
                     proxy = ProxyInfo(
                         host=proxy_data['host'],
                         port=proxy_data['port'],
@@ -208,8 +260,12 @@ class ProxyManager:
                 }
             }
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            if ORJSON_AVAILABLE:
+                content = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            else:
+                content = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+            with open(filepath, 'wb') as f:
+                f.write(content)
             
             self.config_file = Path(filepath)
             return True
@@ -275,21 +331,20 @@ def create_proxy_from_string(proxy_str: str) -> ProxyInfo:
         ProxyInfo对象
     """
     # 解析协议
-    if '://' in proxy_str:
-        protocol, rest = proxy_str.split('://', 1)
-        proxy_type = ProxyType(protocol.lower())
+    protocol, sep, rest = proxy_str.partition('://')
+    if sep:
+        protocol = protocol.lower()
+        proxy_type = _PROTO_MAP.get(protocol) or ProxyType(protocol)
     else:
         rest = proxy_str
         proxy_type = ProxyType.HTTP
     
     # 解析认证信息
-    auth = None
-    if '@' in rest:
-        auth, rest = rest.rsplit('@', 1)
+    auth, _, rest = rest.rpartition('@')
     
     # 解析主机和端口
-    if ':' in rest:
-        host, port = rest.rsplit(':', 1)
+    host, sep, port = rest.rpartition(':')
+    if sep:
         port = int(port)
     else:
         host = rest
@@ -298,10 +353,10 @@ def create_proxy_from_string(proxy_str: str) -> ProxyInfo:
     # 解析用户名和密码
     username = None
     password = None
-    if auth and ':' in auth:
-        username, password = auth.split(':', 1)
-    elif auth:
-        username = auth
+    if auth:
+        username, sep, password = auth.partition(':')
+        if not sep:
+            password = None
     
     return ProxyInfo(
         host=host,
@@ -5,17 +5,43 @@
 提供简洁的配置管理，减少配置层级
 """
 
-import json
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, field
-from pathlib import Path
-
-
+import functools
+from typing import Dict, Iterable, Iterator, Optional, Any, Sequence, Tuple
+from types import MappingProxyType
+from dataclasses import dataclass, field, fields
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+def _with_slots(cls):
+    """为dataclass添加__slots__（dataclass(slots=True)需要Python 3.10）"""
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict['__slots__'] = field_names
+    # 字段默认值已保存在__init__中，类属性会与同名slot冲突
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
+@_with_slots
 @dataclass
 class SimpleSystemConfig:
     """系统指纹配置"""
     name: str
-    patterns: List[Dict[str, str]]
+    patterns: Sequence[Dict[str, str]]
     login_endpoint: str
     method: str = "POST"
     content_type: str = "application/json"
@@ -23,10 +49,41 @@ class SimpleSystemConfig:
     password_field: str = "password"
     password_encryption: str = "none"
     headers: Dict[str, str] = field(default_factory=dict)
-    success_indicators: List[Dict[str, Any]] = field(default_factory=list)
-    failure_indicators: List[Dict[str, Any]] = field(default_factory=list)
+    success_indicators: Sequence[Dict[str, Any]] = field(default_factory=list)
+    failure_indicators: Sequence[Dict[str, Any]] = field(default_factory=list)
+
+
+class _LazySystems(dict):
+    """系统配置字典，值保留原始字典，首次访问时才转换为SimpleSystemConfig"""
+
+    def __getitem__(self, sys_id: str) -> SimpleSystemConfig:
+        sys_config = dict.__getitem__(self, sys_id)
+        if isinstance(sys_config, dict):
+            sys_config = SimpleSystemConfig(**sys_config)
+            dict.__setitem__(self, sys_id, sys_config)
+        return sys_config
+
+    def get(self, sys_id: str, default: Any = None) -> Any:
+        return self[sys_id] if sys_id in self else default
+
+    def items(self) -> Iterator[Tuple[str, SimpleSystemConfig]]:
+        for sys_id in self:
+            yield sys_id, self[sys_id]
 
+    def values(self) -> Iterator[SimpleSystemConfig]:
+        for sys_id in self:
+            yield self[sys_id]
 
+    def patterns(self) -> Iterator[Tuple[str, Sequence[Dict[str, str]]]]:
+        """遍历 (系统ID, 指纹规则)，不触发转换"""
+        for sys_id, sys_config in dict.items(self):
+            if isinstance(sys_config, dict):
+                yield sys_id, sys_config.get('patterns', [])
+            else:
+                yield sys_id, sys_config.patterns
+
+
+@_with_slots
 @dataclass
 class SimpleConfig:
     """简化配置"""
@@ -44,24 +101,23 @@ class SimpleConfig:
     systems: Dict[str, SimpleSystemConfig] = field(default_factory=dict)
 
     def __post_init__(self):
-        """初始化后处理，确保systems字典中的值是SimpleSystemConfig对象"""
-        converted_systems = {}
-        for sys_id, sys_config in self.systems.items():
-            if isinstance(sys_config, dict):
-                converted_systems[sys_id] = SimpleSystemConfig(**sys_config)
-            else:
-                converted_systems[sys_id] = sys_config
-        self.systems = converted_systems
+        """初始化后处理，systems中的字典在首次访问时转换为SimpleSystemConfig对象"""
+        # 已是延迟转换字典时直接使用，不再复制
+        if not isinstance(self.systems, _LazySystems):
+            self.systems = _LazySystems(self.systems)
 
     @classmethod
     def from_file(cls, config_path: str) -> 'SimpleConfig':
         """从JSON文件加载配置"""
-        with open(config_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        systems = {}
-        for sys_id, sys_data in data.get('systems', {}).items():
-            systems[sys_id] = SimpleSystemConfig(**sys_data)
+        with open(config_path, 'rb') as f:
+            content = f.read()
+        # 整个文件一次解析：匹配URL需要所有系统的规则，按需解析反而更慢；
+        # 系统配置对象仍在首次使用时才创建（见_LazySystems）
+        if ORJSON_AVAILABLE:
+            data = orjson.loads(content)
+        else:
+            import json
+            data = json.loads(content)
 
         return cls(
             timeout=data.get('timeout', 30),
@@ -70,11 +126,17 @@ class SimpleConfig:
             user_agent=data.get('user_agent', "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"),
             delay_between_requests=data.get('delay_between_requests', 0.5),
             auto_resume=data.get('auto_resume', True),
-            systems=systems
+            systems=data.get('systems', {})
         )
 
-    def to_file(self, config_path: str):
-        """保存配置到JSON文件"""
+    def to_file(self, config_path: str, compact: bool = False):
+        """
+        保存配置到JSON文件
+
+        Args:
+            config_path: 配置文件路径
+            compact: 输出紧凑格式（供程序读取，体积更小），默认缩进便于手工编辑
+        """
         data = {
             'timeout': self.timeout,
             'max_concurrent': self.max_concurrent,
@@ -82,6 +144,7 @@ class SimpleConfig:
             'user_agent': self.user_agent,
             'delay_between_requests': self.delay_between_requests,
             'auto_resume': self.auto_resume,
+            # 逐字段构造字典：比dataclasses.asdict（递归深拷贝）快得多
             'systems': {
                 sys_id: {
                     'name': sys_config.name,
@@ -100,19 +163,69 @@ class SimpleConfig:
             }
         }
 
-        with open(config_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if ORJSON_AVAILABLE:
+            option = orjson.OPT_NON_STR_KEYS | (0 if compact else orjson.OPT_INDENT_2)
+            content = orjson.dumps(data, option=option)
+        else:
+            import json
+            if compact:
+                content = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            else:
+                content = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+        with open(config_path, 'wb') as f:
+            f.write(content)
+
+
+def _compile_url_rules(systems_patterns: Iterable[Tuple[str, Sequence[Dict[str, str]]]]):
+    """
+    预处理url_contains规则
+
+    Returns:
+        ((规则值, 系统ID), ...)按系统顺序排列，以及由其编译的Aho-Corasick自动机（不可用时为None）
+    """
+    url_patterns = tuple(
+        (pattern.get('value'), sys_id)
+        for sys_id, patterns in systems_patterns
+        for pattern in patterns
+        if pattern.get('type') == 'url_contains'
+    )
+    return url_patterns, _compile_url_automaton(url_patterns)
+
+
+def _compile_url_automaton(url_patterns: Tuple[Tuple[str, str], ...]):
+    """
+    将url_contains规则编译为一个Aho-Corasick自动机，值为(规则序号, 系统ID)
+
+    未安装pyahocorasick或规则值为空（无法放入自动机）时返回None，保持逐条匹配。
+    """
+    if not AHOCORASICK_AVAILABLE:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for order, (pattern_value, sys_id) in enumerate(url_patterns):
+        if not pattern_value or not isinstance(pattern_value, str):
+            return None
+        # 同一规则属于多个系统时保留靠前的系统
+        if pattern_value not in automaton:
+            automaton.add_word(pattern_value, (order, sys_id))
+
+    if not len(automaton):
+        return None
+    automaton.make_automaton()
+    return automaton
 
 
 class SimpleConfigManager:
     """简化配置管理器"""
 
-    DEFAULT_SYSTEMS = {
+    # 内置系统配置只读共享，列表字段使用元组
+    DEFAULT_SYSTEMS = MappingProxyType({
         "httpbin": {
             "name": "HTTPBin测试",
-            "patterns": [
-                {"type": "url_contains", "value": "httpbin.org"}
-            ],
+            "patterns": (
+                {"type": "url_contains", "value": "httpbin.org"},
+            ),
             "login_endpoint": "/post",
             "method": "POST",
             "content_type": "application/json",
@@ -120,18 +233,18 @@ class SimpleConfigManager:
             "password_field": "password",
             "password_encryption": "none",
             "headers": {},
-            "success_indicators": [
+            "success_indicators": (
                 {"type": "status_code", "value": 200},
                 {"type": "body_length_gt", "value": 50}
-            ],
-            "failure_indicators": []
+            ),
+            "failure_indicators": ()
         },
         "shanying_crm": {
             "name": "山鹰CRM系统",
-            "patterns": [
+            "patterns": (
                 {"type": "url_contains", "value": "shanyingintl"},
                 {"type": "url_contains", "value": "crmzzapp"}
-            ],
+            ),
             "login_endpoint": "/api/user/login",
             "method": "POST",
             "content_type": "application/json",
@@ -142,20 +255,20 @@ class SimpleConfigManager:
                 "X-Source": "4",
                 "Accept": "application/json, text/plain, */*"
             },
-            "success_indicators": [
+            "success_indicators": (
                 {"type": "status_code", "value": 200},
                 {"type": "body_length_gt", "value": 100},
                 {"type": "body_not_contains", "value": "Message"}
-            ],
-            "failure_indicators": [
-                {"type": "body_contains", "value": "Message"}
-            ]
+            ),
+            "failure_indicators": (
+                {"type": "body_contains", "value": "Message"},
+            )
         },
         "shanying_tms": {
             "name": "山鹰TMS系统",
-            "patterns": [
-                {"type": "url_contains", "value": "shanyingtms"}
-            ],
+            "patterns": (
+                {"type": "url_contains", "value": "shanyingtms"},
+            ),
             "login_endpoint": "/shanyingtms/a/login",
             "method": "POST",
             "content_type": "application/x-www-form-urlencoded",
@@ -163,15 +276,15 @@ class SimpleConfigManager:
             "password_field": "password",
             "password_encryption": "none",
             "headers": {},
-            "success_indicators": [
+            "success_indicators": (
                 {"type": "status_code", "value": 200},
                 {"type": "body_length_gt", "value": 100}
-            ],
-            "failure_indicators": []
+            ),
+            "failure_indicators": ()
         },
         "generic": {
             "name": "通用系统",
-            "patterns": [],
+            "patterns": (),
             "login_endpoint": "/login",
             "method": "POST",
             "content_type": "application/x-www-form-urlencoded",
@@ -179,12 +292,15 @@ class SimpleConfigManager:
             "password_field": "password",
             "password_encryption": "none",
             "headers": {},
-            "success_indicators": [
-                {"type": "status_code", "value": 200}
-            ],
-            "failure_indicators": []
+            "success_indicators": (
+                {"type": "status_code", "value": 200},
+            ),
+            "failure_indicators": ()
         }
-    }
+    })
+
+    # URL匹配结果缓存上限，超出后清空重新累积
+    URL_CACHE_SIZE = 1024
 
     DEFAULT_CONFIG = {
         "timeout": 30,
@@ -203,14 +319,19 @@ class SimpleConfigManager:
         Args:
             config_path: 配置文件路径，如果为None则使用默认配置
         """
-        if config_path and Path(config_path).exists():
-            self.config = SimpleConfig.from_file(config_path)
-        else:
-            # 转换DEFAULT_CONFIG中的systems字典为SimpleSystemConfig对象
-            systems = {}
-            for sys_id, sys_data in self.DEFAULT_SYSTEMS.items():
-                systems[sys_id] = SimpleSystemConfig(**sys_data)
+        # URL -> 匹配的系统配置（同一目标地址会被反复验证）
+        self._url_cache: Dict[str, SimpleSystemConfig] = {}
 
+        # 直接尝试打开，不单独检查文件是否存在
+        try:
+            self.config = SimpleConfig.from_file(config_path) if config_path else None
+        except FileNotFoundError:
+            self.config = None
+
+        if self.config is not None:
+            self._build_url_rules()
+        else:
+            # systems中的系统配置在首次使用时才创建SimpleSystemConfig对象
             self.config = SimpleConfig(
                 timeout=self.DEFAULT_CONFIG['timeout'],
                 max_concurrent=self.DEFAULT_CONFIG['max_concurrent'],
@@ -218,8 +339,22 @@ class SimpleConfigManager:
                 user_agent=self.DEFAULT_CONFIG['user_agent'],
                 delay_between_requests=self.DEFAULT_CONFIG['delay_between_requests'],
                 auto_resume=self.DEFAULT_CONFIG['auto_resume'],
-                systems=systems
+                systems=self.DEFAULT_SYSTEMS
             )
+            # 默认规则对所有实例相同，只编译一次
+            self._url_patterns, self._url_automaton = _default_url_rules()
+
+        # 扫描时按请求读取的参数直接作为实例属性（加载时的值，之后修改config不会同步）
+        self.timeout: int = self.config.timeout
+        self.max_concurrent: int = self.config.max_concurrent
+        self.verify_ssl: bool = self.config.verify_ssl
+        self.user_agent: str = self.config.user_agent
+        self.delay_between_requests: float = self.config.delay_between_requests
+
+    def _build_url_rules(self):
+        """重新编译URL匹配规则，修改config.systems后需要调用"""
+        self._url_cache.clear()
+        self._url_patterns, self._url_automaton = _compile_url_rules(self.config.systems.patterns())
 
     def get_system_config(self, url: str) -> SimpleSystemConfig:
         """
@@ -231,42 +366,43 @@ class SimpleConfigManager:
         Returns:
             系统配置
         """
-        # 遍历所有系统配置，查找匹配的
-        for sys_id, sys_config in self.config.systems.items():
-            for pattern in sys_config.patterns:
-                pattern_type = pattern.get('type')
-                pattern_value = pattern.get('value')
-
-                if pattern_type == 'url_contains':
-                    if pattern_value in url:
-                        return sys_config
+        sys_config = self._url_cache.get(url)
+        if sys_config is None:
+            sys_config = self._match_system_config(url)
+            if len(self._url_cache) >= self.URL_CACHE_SIZE:
+                self._url_cache.clear()
+            self._url_cache[url] = sys_config
+        return sys_config
+
+    def _match_system_config(self, url: str) -> SimpleSystemConfig:
+        """按指纹规则匹配系统配置"""
+        if self._url_automaton is not None:
+            # 一次扫描URL找出所有命中的规则，取最靠前的规则所属系统
+            matches = [value for _, value in self._url_automaton.iter(url)]
+            if matches:
+                return self.config.systems[min(matches)[1]]
+        else:
+            # 按系统顺序逐条匹配，只转换匹配的系统配置
+            # （re的多分支正则会在URL每个位置逐一尝试各分支，实测比逐条子串查找慢一个数量级）
+            for pattern_value, sys_id in self._url_patterns:
+                if pattern_value in url:
+                    return self.config.systems[sys_id]
 
         # 如果没有匹配的，返回通用配置
         return self.config.systems.get('generic', self.config.systems.get('httpbin'))
 
-    def save_config(self, config_path: str):
-        """保存配置到文件"""
-        self.config.to_file(config_path)
-
-    @property
-    def timeout(self) -> int:
-        return self.config.timeout
-
-    @property
-    def max_concurrent(self) -> int:
-        return self.config.max_concurrent
-
-    @property
-    def verify_ssl(self) -> bool:
-        return self.config.verify_ssl
+    def save_config(self, config_path: str, compact: bool = False):
+        """保存配置到文件（compact为True时输出紧凑格式）"""
+        self.config.to_file(config_path, compact)
 
-    @property
-    def user_agent(self) -> str:
-        return self.config.user_agent
 
-    @property
-    def delay_between_requests(self) -> float:
-        return self.config.delay_between_requests
+@functools.lru_cache(maxsize=None)
+def _default_url_rules():
+    """默认系统配置的URL匹配规则（只读，所有实例共享）"""
+    return _compile_url_rules(
+        (sys_id, sys_data['patterns'])
+        for sys_id, sys_data in SimpleConfigManager.DEFAULT_SYSTEMS.items()
+    )
 
 
 # 全局配置管理器实例
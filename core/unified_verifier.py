@@ -8,20 +8,33 @@
 import asyncio
 import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import functools
 import hashlib
 import base64
 import time
 import re
 import json
-import chardet
-from typing import Dict, List, Optional, Tuple, Any, Callable, Union
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Any, Callable, Union
 from dataclasses import dataclass, field
 from enum import Enum
 from urllib.parse import urljoin, urlparse
-from datetime import datetime
+
+try:
+    import chardet
+    CHARDET_AVAILABLE = True
+except ImportError:
+    CHARDET_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from .config_manager import ConfigManager, SystemConfig, get_config_manager
-from .simple_config import SimpleConfigManager, SimpleSystemConfig, get_simple_config_manager
+from .simple_config import SimpleConfigManager, SimpleSystemConfig, get_simple_config_manager, _with_slots
 
 
 class VerifyMode(Enum):
@@ -42,6 +55,7 @@ class LoginStatus(Enum):
     UNKNOWN_ERROR = "未知错误"
 
 
+@_with_slots
 @dataclass
 class LoginResult:
     """登录结果"""
@@ -53,9 +67,10 @@ class LoginResult:
     final_url: str
     page_changed: bool
     details: Optional[Dict[str, Any]] = field(default=None)
-    timestamp: str = field(default_factory=lambda: datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    timestamp: str = field(default_factory=lambda: time.strftime("%Y-%m-%d %H:%M:%S"))
 
 
+@_with_slots
 @dataclass
 class TargetInfo:
     """目标信息"""
@@ -70,12 +85,93 @@ class TargetInfo:
         return bool(self.url and self.username and self.password)
 
 
+def _loads_json(content: str) -> Any:
+    """解析JSON响应体，优先使用orjson"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _dumps_json(obj: Any) -> bytes:
+    """序列化JSON请求体，优先使用orjson（Content-Type已在请求头中设置）"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+# 未声明charset或声明的charset解码失败时依次尝试的编码（gbk已覆盖gb2312）
+# 不直接按utf-8替换解码：未声明charset的国内系统常返回GBK，乱码会导致中文指标无法匹配
+_FALLBACK_ENCODINGS = ('utf-8', 'gbk', 'gb18030', 'big5')
+
+
+def _decode_body(content_bytes: bytes, charset: Optional[str], use_chardet: bool = False) -> str:
+    """
+    解码响应内容
+
+    顺序：响应头声明的charset -> chardet探测（仅在启用时） -> 常见编码 -> iso-8859-1
+    """
+    if charset:
+        try:
+            return content_bytes.decode(charset)
+        except (UnicodeDecodeError, LookupError):
+            pass
+
+    if use_chardet and CHARDET_AVAILABLE:
+        detected = chardet.detect(content_bytes)
+        if detected and detected.get('confidence', 0) > 0.5:
+            detected_encoding = detected.get('encoding')
+            if detected_encoding:
+                try:
+                    return content_bytes.decode(detected_encoding)
+                except (UnicodeDecodeError, LookupError):
+                    pass
+
+    for encoding in _FALLBACK_ENCODINGS:
+        try:
+            return content_bytes.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+
+    return content_bytes.decode('iso-8859-1', errors='replace')
+
+
+def _header_charset(content_type: str) -> Optional[str]:
+    """从Content-Type中取出charset，未声明时返回None"""
+    _, sep, charset = content_type.partition('charset=')
+    if not sep:
+        return None
+    return charset.split(';', 1)[0].strip().strip('"\'') or None
+
+
+@functools.lru_cache(maxsize=65536)
+def _encrypt_password_cached(password: str, method: str) -> str:
+    """按 (密码, 方法) 缓存加密结果，同一字典对多个目标时每个密码只计算一次"""
+    if method == 'md5':
+        return hashlib.md5(password.encode()).hexdigest()
+    elif method == 'md5_upper':
+        return hashlib.md5(password.encode()).hexdigest().upper()
+    elif method == 'sha1':
+        return hashlib.sha1(password.encode()).hexdigest()
+    elif method == 'sha256':
+        return hashlib.sha256(password.encode()).hexdigest()
+    elif method == 'base64':
+        return base64.b64encode(password.encode()).decode()
+    elif method == 'md5_base64':
+        md5_hash = hashlib.md5(password.encode()).hexdigest()
+        return base64.b64encode(md5_hash.encode()).decode()
+    else:
+        return password
+
+
 class UnifiedVerifier:
     """
     统一验证器
     支持同步和异步两种验证模式
     """
 
+    # 目标URL解析结果缓存的最大条目数，超出时整体清空
+    TARGET_CACHE_SIZE = 1024
+
     def __init__(
         self,
         config_manager: Optional[Union[ConfigManager, SimpleConfigManager]] = None,
@@ -83,7 +179,9 @@ class UnifiedVerifier:
         max_concurrent: int = 5,
         progress_callback: Optional[Callable[[int, int], None]] = None,
         log_callback: Optional[Callable[[str], None]] = None,
-        use_simple_config: bool = True
+        use_simple_config: bool = True,
+        per_host_concurrent: Optional[int] = None,
+        use_chardet: bool = False
     ):
         """
         初始化统一验证器
@@ -95,20 +193,40 @@ class UnifiedVerifier:
             progress_callback: 进度回调函数 (current, total)
             log_callback: 日志回调函数
             use_simple_config: 是否使用简化配置管理器
+            per_host_concurrent: 单个主机的最大连接数（异步模式），默认与max_concurrent相同
+            use_chardet: 响应未声明charset且非UTF-8时是否使用chardet探测编码（较慢，需安装chardet）
         """
         if use_simple_config:
             self.config_manager = config_manager or get_simple_config_manager()
         else:
             self.config_manager = config_manager or get_config_manager()
 
+        # 网络配置（兼容两种配置管理器），只解析一次
+        if isinstance(self.config_manager, SimpleConfigManager):
+            self._network_config = self.config_manager
+        else:
+            self._network_config = self.config_manager.config.network
+
         self.mode = mode
         self.max_concurrent = max_concurrent
+        self.per_host_concurrent = per_host_concurrent or max_concurrent
+        self.use_chardet = use_chardet
         self.progress_callback = progress_callback
         self.log_callback = log_callback
 
+        # 目标URL解析结果缓存：url -> (完整登录地址, 系统配置, 请求方法, 请求头)
+        # 按完整URL而非主机缓存：系统识别规则会匹配路径，同一主机的不同路径可能对应不同系统
+        self._target_cache: Dict[str, Tuple[str, Union[SystemConfig, SimpleSystemConfig], str, Dict[str, str]]] = {}
+
+        # 同步会话（首次同步验证时创建，复用keep-alive连接）
+        self._sync_session: Optional[requests.Session] = None
+
         # 异步会话
         self._async_session: Optional[aiohttp.ClientSession] = None
 
+        # 异步批量验证补足工作协程的回调（批量验证期间存在，用于运行中调高并发数）
+        self._top_up_workers: Optional[Callable[[], None]] = None
+
         # 统计
         self.stats = {
             'total': 0,
@@ -125,7 +243,36 @@ class UnifiedVerifier:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """同步上下文管理器出口"""
-        pass
+        self._close_sync_session()
+
+    def _get_sync_session(self) -> requests.Session:
+        """获取同步会话（不存在时创建）"""
+        if self._sync_session is None:
+            session = requests.Session()
+            # 同步模式逐个发送请求，HTTP/2多路复用没有可并行的请求，复用keep-alive连接即可
+            # 连接池大小与异步模式保持一致；只重试建立连接阶段的失败（请求尚未发出），
+            # 读超时和5xx响应不重试，每组凭据只提交一次，避免额外计入目标的失败次数/账号锁定
+            adapter = HTTPAdapter(
+                pool_connections=self.max_concurrent,
+                pool_maxsize=self.max_concurrent * 4,
+                max_retries=Retry(
+                    total=2,
+                    connect=2,
+                    read=False,
+                    status=0,
+                    backoff_factor=0.3
+                )
+            )
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self._sync_session = session
+        return self._sync_session
+
+    def _close_sync_session(self):
+        """关闭同步会话"""
+        if self._sync_session:
+            self._sync_session.close()
+            self._sync_session = None
 
     async def __aenter__(self):
         """异步上下文管理器入口"""
@@ -139,16 +286,14 @@ class UnifiedVerifier:
     async def _start_async_session(self):
         """启动异步会话"""
         if self._async_session is None:
-            # 获取网络配置（兼容两种配置管理器）
-            if isinstance(self.config_manager, SimpleConfigManager):
-                # SimpleConfigManager
-                network_config = self.config_manager
-            else:
-                # ConfigManager
-                network_config = self.config_manager.config.network
+            network_config = self._network_config
 
+            # 总连接数留出余量供运行中调高并发，单个主机另行限制，避免慢目标占满连接池
             connector = aiohttp.TCPConnector(
-                limit=self.max_concurrent,
+                limit=self.max_concurrent * 4,
+                limit_per_host=self.per_host_concurrent,
+                ttl_dns_cache=300,
+                keepalive_timeout=30,
                 ssl=network_config.verify_ssl,
                 force_close=False
             )
@@ -174,30 +319,55 @@ class UnifiedVerifier:
             await self._async_session.close()
             self._async_session = None
 
+    async def set_max_concurrent(self, max_concurrent: int):
+        """
+        调整最大并发数，正在进行的异步批量验证立即生效
+
+        Args:
+            max_concurrent: 最大并发数
+        """
+        self.max_concurrent = max(1, max_concurrent)
+
+        # 调高时立即补足工作协程；调低时多余的工作协程完成当前目标后自行退出
+        if self._top_up_workers is not None:
+            self._top_up_workers()
+
     def _log(self, message: str, level: str = "INFO"):
         """记录日志"""
         if self.log_callback:
             self.log_callback(f"[{level}] {message}")
 
+    def _resolve_target(self, url: str) -> Tuple[str, Union[SystemConfig, SimpleSystemConfig], str, Dict[str, str]]:
+        """
+        解析目标URL，返回 (完整登录地址, 系统配置, 请求方法, 请求头)，同一URL只解析一次
+
+        请求头在各次请求间共享，调用方不得修改
+        """
+        resolved = self._target_cache.get(url)
+        if resolved is None:
+            sys_config = self.config_manager.get_system_config(url)
+
+            parsed = urlparse(url)
+            base_url = f"{parsed.scheme}://{parsed.netloc}"
+            endpoint = parsed.path if parsed.path and parsed.path != '/' else sys_config.login_endpoint
+            full_url = urljoin(base_url, endpoint)
+
+            headers = dict(sys_config.headers)
+            headers['User-Agent'] = self._network_config.user_agent
+            if sys_config.content_type == 'application/json':
+                headers['Content-Type'] = 'application/json'
+
+            resolved = (full_url, sys_config, sys_config.method.upper(), headers)
+            if len(self._target_cache) >= self.TARGET_CACHE_SIZE:
+                self._target_cache.clear()
+            self._target_cache[url] = resolved
+        return resolved
+
     def _encrypt_password(self, password: str, method: str) -> str:
         """根据方法加密密码"""
         if method == 'none' or method is None:
             return password
-        elif method == 'md5':
-            return hashlib.md5(password.encode()).hexdigest()
-        elif method == 'md5_upper':
-            return hashlib.md5(password.encode()).hexdigest().upper()
-        elif method == 'sha1':
-            return hashlib.sha1(password.encode()).hexdigest()
-        elif method == 'sha256':
-            return hashlib.sha256(password.encode()).hexdigest()
-        elif method == 'base64':
-            return base64.b64encode(password.encode()).decode()
-        elif method == 'md5_base64':
-            md5_hash = hashlib.md5(password.encode()).hexdigest()
-            return base64.b64encode(md5_hash.encode()).decode()
-        else:
-            return password
+        return _encrypt_password_cached(password, method)
 
     def _build_request_body(
         self,
@@ -220,20 +390,28 @@ class UnifiedVerifier:
         sys_config: SystemConfig
     ) -> Tuple[bool, str]:
         """检查响应是否成功"""
+        # 已确认不在响应中的失败标识，成功指标中的同一文本不再重复扫描响应体
+        # （指标通常只有一两条，str的in比Aho-Corasick多模式匹配更快，故逐条检查；
+        #  整个判断每个响应仅约2~9us，相对网络往返可忽略，不值得引入C扩展或hyperscan）
+        absent = set()
+
         # 首先检查失败指标
         for indicator in sys_config.failure_indicators:
             ind_type = indicator.get('type')
             ind_value = indicator.get('value')
 
             if ind_type == 'body_contains':
+                if ind_value in absent:
+                    continue
                 if ind_value in content:
                     try:
-                        data = json.loads(content)
+                        data = _loads_json(content)
                         if isinstance(data, dict) and 'Message' in data:
                             return False, data['Message']
                     except:
                         pass
                     return False, f"包含失败标识: {ind_value}"
+                absent.add(ind_value)
             elif ind_type == 'status_code':
                 if status_code == ind_value:
                     return False, f"HTTP状态码: {ind_value}"
@@ -251,10 +429,10 @@ class UnifiedVerifier:
                 if len(content) > ind_value:
                     success_count += 1
             elif ind_type == 'body_contains':
-                if ind_value in content:
+                if ind_value not in absent and ind_value in content:
                     success_count += 1
             elif ind_type == 'body_not_contains':
-                if ind_value not in content:
+                if ind_value in absent or ind_value not in content:
                     success_count += 1
 
         # 至少满足一半的成功指标
@@ -267,46 +445,34 @@ class UnifiedVerifier:
 
     def _verify_sync(self, target: TargetInfo) -> LoginResult:
         """同步验证单个目标"""
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
-            sys_config = self.config_manager.get_system_config(target.url)
-
-            # 获取网络配置（兼容两种配置管理器）
-            if isinstance(self.config_manager, SimpleConfigManager):
-                # SimpleConfigManager
-                network_config = self.config_manager
-            else:
-                # ConfigManager
-                network_config = self.config_manager.config.network
-
-            parsed = urlparse(target.url)
-            base_url = f"{parsed.scheme}://{parsed.netloc}"
-            endpoint = parsed.path if parsed.path and parsed.path != '/' else sys_config.login_endpoint
-            full_url = urljoin(base_url, endpoint)
+            full_url, sys_config, method, headers = self._resolve_target(target.url)
 
-            method = sys_config.method.upper()
-            headers = sys_config.headers.copy()
-            headers['User-Agent'] = network_config.user_agent
+            network_config = self._network_config
 
             body = self._build_request_body(target.username, target.password, sys_config)
 
             # 获取超时和SSL配置
-            timeout = getattr(network_config, 'timeout', 30)
-            verify_ssl = getattr(network_config, 'verify_ssl', False)
+            timeout = network_config.timeout
+            verify_ssl = network_config.verify_ssl
 
-            # 发送请求
+            # 发送请求（只复用连接池，不复用Cookie：每次尝试都是独立登录，
+            # 上一次成功登录的会话Cookie不能带入下一次尝试）
+            session = self._get_sync_session()
+            session.cookies.clear()
             if method == 'POST':
                 if sys_config.content_type == 'application/json':
-                    response = requests.post(
+                    response = session.post(
                         full_url,
-                        json=body,
+                        data=_dumps_json(body),
                         headers=headers,
                         timeout=timeout,
                         verify=verify_ssl
                     )
                 else:
-                    response = requests.post(
+                    response = session.post(
                         full_url,
                         data=body,
                         headers=headers,
@@ -314,7 +480,7 @@ class UnifiedVerifier:
                         verify=verify_ssl
                     )
             else:
-                response = requests.get(
+                response = session.get(
                     full_url,
                     params=body,
                     headers=headers,
@@ -322,18 +488,14 @@ class UnifiedVerifier:
                     verify=verify_ssl
                 )
 
-            # 处理编码
-            try:
-                content = response.text
-            except UnicodeDecodeError:
-                content_bytes = response.content
-                detected = chardet.detect(content_bytes)
-                if detected and detected.get('confidence', 0) > 0.5:
-                    content = content_bytes.decode(detected.get('encoding', 'utf-8'))
-                else:
-                    content = content_bytes.decode('gbk', errors='replace')
+            # 处理编码（不使用response.text，避免requests对未声明charset的响应做编码探测）
+            content = _decode_body(
+                response.content,
+                _header_charset(response.headers.get('Content-Type', '')),
+                self.use_chardet
+            )
 
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             success, message = self._check_response(response.status_code, content, sys_config)
 
             return LoginResult(
@@ -352,7 +514,7 @@ class UnifiedVerifier:
             )
 
         except requests.exceptions.Timeout:
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             return LoginResult(
                 status=LoginStatus.TIMEOUT_ERROR,
                 success=False,
@@ -363,7 +525,7 @@ class UnifiedVerifier:
                 page_changed=False
             )
         except requests.exceptions.RequestException as e:
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             return LoginResult(
                 status=LoginStatus.CONNECTION_ERROR,
                 success=False,
@@ -374,7 +536,7 @@ class UnifiedVerifier:
                 page_changed=False
             )
         except Exception as e:
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             return LoginResult(
                 status=LoginStatus.UNKNOWN_ERROR,
                 success=False,
@@ -427,69 +589,29 @@ class UnifiedVerifier:
 
     async def _get_response_text(self, response: aiohttp.ClientResponse) -> str:
         """获取响应文本内容，自动处理编码问题"""
+        # 整体读取而非边读边匹配指标：body_not_contains、Message提取和content_length都需要完整响应体，
+        # 中途关闭响应还会丢弃keep-alive连接，且未声明charset时的编码回退无法增量进行
         try:
-            return await response.text()
-        except UnicodeDecodeError:
-            try:
-                content_bytes = await response.read()
-                content_type = response.headers.get('Content-Type', '')
-                charset = None
-                if 'charset=' in content_type:
-                    charset = content_type.split('charset=')[-1].strip()
-
-                if charset:
-                    try:
-                        return content_bytes.decode(charset)
-                    except (UnicodeDecodeError, LookupError):
-                        pass
-
-                detected = chardet.detect(content_bytes)
-                if detected and detected.get('confidence', 0) > 0.5:
-                    detected_encoding = detected.get('encoding')
-                    if detected_encoding:
-                        try:
-                            return content_bytes.decode(detected_encoding)
-                        except (UnicodeDecodeError, LookupError):
-                            pass
-
-                common_encodings = ['gbk', 'gb2312', 'gb18030', 'big5']
-                for encoding in common_encodings:
-                    try:
-                        return content_bytes.decode(encoding)
-                    except (UnicodeDecodeError, LookupError):
-                        continue
-
-                return content_bytes.decode('iso-8859-1', errors='replace')
-
-            except Exception as e:
-                return f"<编码错误: {str(e)[:50]}>"
+            content_bytes = await response.read()
+            return _decode_body(content_bytes, response.charset, self.use_chardet)
+        except Exception as e:
+            return f"<编码错误: {str(e)[:50]}>"
 
     async def _verify_async(self, target: TargetInfo) -> LoginResult:
         """异步验证单个目标"""
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
-            sys_config = self.config_manager.get_system_config(target.url)
-
-            parsed = urlparse(target.url)
-            base_url = f"{parsed.scheme}://{parsed.netloc}"
-            endpoint = parsed.path if parsed.path and parsed.path != '/' else sys_config.login_endpoint
-            full_url = urljoin(base_url, endpoint)
-
-            method = sys_config.method.upper()
-            headers = sys_config.headers.copy()
-
-            if sys_config.content_type == 'application/json':
-                headers['Content-Type'] = 'application/json'
+            full_url, sys_config, method, headers = self._resolve_target(target.url)
 
             body = self._build_request_body(target.username, target.password, sys_config)
 
             # 发送请求
             if method == 'POST':
                 if sys_config.content_type == 'application/json':
-                    async with self._async_session.post(full_url, json=body, headers=headers) as response:
+                    async with self._async_session.post(full_url, data=_dumps_json(body), headers=headers) as response:
                         content = await self._get_response_text(response)
-                        elapsed = time.time() - start_time
+                        elapsed = time.monotonic() - start_time
                         success, message = self._check_response(response.status, content, sys_config)
 
                         return LoginResult(
@@ -509,7 +631,7 @@ class UnifiedVerifier:
                 else:
                     async with self._async_session.post(full_url, data=body, headers=headers) as response:
                         content = await self._get_response_text(response)
-                        elapsed = time.time() - start_time
+                        elapsed = time.monotonic() - start_time
                         success, message = self._check_response(response.status, content, sys_config)
 
                         return LoginResult(
@@ -529,7 +651,7 @@ class UnifiedVerifier:
             else:
                 async with self._async_session.get(full_url, params=body, headers=headers) as response:
                     content = await self._get_response_text(response)
-                    elapsed = time.time() - start_time
+                    elapsed = time.monotonic() - start_time
                     success, message = self._check_response(response.status, content, sys_config)
 
                     return LoginResult(
@@ -548,7 +670,7 @@ class UnifiedVerifier:
                     )
 
         except asyncio.TimeoutError:
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             return LoginResult(
                 status=LoginStatus.TIMEOUT_ERROR,
                 success=False,
@@ -559,7 +681,7 @@ class UnifiedVerifier:
                 page_changed=False
             )
         except aiohttp.ClientError as e:
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             return LoginResult(
                 status=LoginStatus.CONNECTION_ERROR,
                 success=False,
@@ -570,7 +692,7 @@ class UnifiedVerifier:
                 page_changed=False
             )
         except Exception as e:
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             return LoginResult(
                 status=LoginStatus.UNKNOWN_ERROR,
                 success=False,
@@ -581,69 +703,133 @@ class UnifiedVerifier:
                 page_changed=False
             )
 
-    async def verify_batch_async(
+    async def verify_batch_iter(
         self,
         targets: List[TargetInfo],
         delay: float = 0.5
-    ) -> List[LoginResult]:
-        """批量验证（异步模式）"""
+    ) -> AsyncIterator[Tuple[int, LoginResult]]:
+        """
+        批量验证（异步模式），按完成顺序逐个产出结果
+
+        Args:
+            targets: 目标列表
+            delay: 同一主机的请求间隔（秒），每个主机每delay秒最多发出per_host_concurrent个请求
+
+        Yields:
+            (目标在列表中的序号, 登录结果)
+        """
         if self._async_session is None:
             await self._start_async_session()
 
         total = len(targets)
-        semaphore = asyncio.Semaphore(self.max_concurrent)
-
-        async def verify_with_limit(target: TargetInfo) -> LoginResult:
-            """带并发限制的验证"""
-            async with semaphore:
-                result = await self._verify_async(target)
-
-                # 更新统计
-                self.stats['total'] += 1
-                if result.success:
-                    self.stats['success'] += 1
-                elif result.status in [LoginStatus.CONNECTION_ERROR, LoginStatus.TIMEOUT_ERROR, LoginStatus.UNKNOWN_ERROR]:
-                    self.stats['errors'] += 1
-                else:
-                    self.stats['failed'] += 1
-
-                # 回调
-                if self.progress_callback:
-                    self.progress_callback(self.stats['total'], total)
-
-                # 日志
-                if self.log_callback:
-                    status_icon = "[OK]" if result.success else "[FAIL]"
-                    self._log(f"{status_icon} {target.url} - {target.username}:{target.password} - {result.message} ({result.response_time:.2f}s)")
-
-                # 延迟
-                if delay > 0:
-                    await asyncio.sleep(delay)
-
-                return result
-
-        # 并发执行
-        tasks = [verify_with_limit(target) for target in targets]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # 处理异常
-        valid_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                target = targets[i]
-                valid_results.append(LoginResult(
-                    status=LoginStatus.UNKNOWN_ERROR,
-                    success=False,
-                    message=f"任务异常: {str(result)[:50]}",
-                    response_time=0,
-                    url=target.url,
-                    final_url=target.url,
-                    page_changed=False
-                ))
+
+        # 进度回调最多触发约1000次（最后一个完成时必定触发），大批量时避免界面更新拖慢验证
+        progress_interval = max(1, total // 1000)
+        completed = 0
+
+        # 固定数量的工作协程依次领取目标，协程数即并发数，不为每个目标创建任务；
+        # 完成的结果经队列交给调用方，队列满时工作协程等待调用方取走结果
+        done_queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_concurrent)
+        dispatched = 0
+        workers = set()
+
+        # 请求节流：按主机分别计时，同一主机的请求按发出时间均匀间隔（该主机的每个连接槽位
+        # 相当于每delay秒发出一个请求），调高总并发不会加快对单个主机的请求，不同主机互不影响；
+        # 取代请求完成后在槽位内sleep，槽位在请求结束后立即释放
+        pacers: Dict[str, list] = {}    # 主机 -> [锁, 上次发出时间]
+
+        async def pace(host: str):
+            pacer = pacers.get(host)
+            if pacer is None:
+                pacer = pacers[host] = [asyncio.Lock(), float('-inf')]
+            async with pacer[0]:
+                wait = pacer[1] + delay / self.per_host_concurrent - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                pacer[1] = time.monotonic()
+
+        async def verify_one(target: TargetInfo) -> LoginResult:
+            """验证单个目标并更新统计、回调"""
+            nonlocal completed
+            if delay > 0:
+                await pace(urlparse(target.url).netloc)
+
+            result = await self._verify_async(target)
+
+            # 更新统计
+            self.stats['total'] += 1
+            if result.success:
+                self.stats['success'] += 1
+            elif result.status in [LoginStatus.CONNECTION_ERROR, LoginStatus.TIMEOUT_ERROR, LoginStatus.UNKNOWN_ERROR]:
+                self.stats['errors'] += 1
             else:
-                valid_results.append(result)
+                self.stats['failed'] += 1
 
-        return valid_results
+            # 回调
+            completed += 1
+            if self.progress_callback and (completed % progress_interval == 0 or completed == total):
+                self.progress_callback(self.stats['total'], total)
+
+            # 日志
+            if self.log_callback:
+                status_icon = "[OK]" if result.success else "[FAIL]"
+                self._log(f"{status_icon} {target.url} - {target.username}:{target.password} - {result.message} ({result.response_time:.2f}s)")
+
+            return result
+
+        async def worker():
+            """工作协程：领取下一个目标，工作协程数超过max_concurrent时退出"""
+            nonlocal dispatched
+            try:
+                while dispatched < total and len(workers) <= self.max_concurrent:
+                    index = dispatched
+                    dispatched += 1
+                    target = targets[index]
+                    try:
+                        result = await verify_one(target)
+                    except Exception as e:
+                        # _verify_async已自行处理请求异常，这里兜底进度/日志回调抛出的异常；
+                        # 不捕获CancelledError，保证批量验证可以被取消
+                        result = LoginResult(
+                            status=LoginStatus.UNKNOWN_ERROR,
+                            success=False,
+                            message=f"任务异常: {str(e)[:50]}",
+                            response_time=0,
+                            url=target.url,
+                            final_url=target.url,
+                            page_changed=False
+                        )
+                    await done_queue.put((index, result))
+            finally:
+                workers.discard(asyncio.current_task())
+
+        def top_up():
+            spawn = min(self.max_concurrent - len(workers), total - dispatched)
+            for _ in range(spawn):
+                workers.add(asyncio.ensure_future(worker()))
+
+        self._top_up_workers = top_up
+        try:
+            top_up()
+            # 每个目标恰好产出一个结果
+            for _ in range(total):
+                yield await done_queue.get()
+        finally:
+            if self._top_up_workers is top_up:
+                self._top_up_workers = None
+            for task in workers:
+                task.cancel()
+
+    async def verify_batch_async(
+        self,
+        targets: List[TargetInfo],
+        delay: float = 0.5
+    ) -> List[LoginResult]:
+        """批量验证（异步模式），结果顺序与目标顺序一致"""
+        results: List[Optional[LoginResult]] = [None] * len(targets)
+        async for index, result in self.verify_batch_iter(targets, delay):
+            results[index] = result
+        return results
 
     # ==================== 统一接口 ====================
 
@@ -718,8 +904,8 @@ def verify_single_sync(
 ) -> LoginResult:
     """快速同步验证单个目标"""
     target = TargetInfo(url=url, username=username, password=password)
-    verifier = UnifiedVerifier(config_manager, mode=VerifyMode.SYNC)
-    return verifier.verify(target)
+    with UnifiedVerifier(config_manager, mode=VerifyMode.SYNC) as verifier:
+        return verifier.verify(target)
 
 
 async def verify_single_async(
@@ -741,13 +927,13 @@ def verify_batch_sync_quick(
     log_callback: Optional[Callable[[str], None]] = None
 ) -> List[LoginResult]:
     """快速同步批量验证"""
-    verifier = UnifiedVerifier(
+    with UnifiedVerifier(
         config_manager,
         mode=VerifyMode.SYNC,
         progress_callback=progress_callback,
         log_callback=log_callback
-    )
-    return verifier.verify_batch(targets)
+    ) as verifier:
+        return verifier.verify_batch(targets)
 
 
 async def verify_batch_async_quick(
@@ -9,11 +9,52 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from typing import Callable, Optional, List, Dict, Any
 from pathlib import Path
+import importlib.util
 import json
 import csv
 from enum import Enum
 
-from .enhanced_batch_importer import EnhancedBatchImporter, ImportFormat, get_supported_formats
+
+# 依赖检查列表 (包名, 级别)
+_DEPENDENCIES = (
+    ('requests', '必需'),
+    ('beautifulsoup4', '必需'),
+    ('aiohttp', '推荐'),
+    ('Pillow', '可选'),
+    ('pytesseract', '可选'),
+    ('pandas', '可选'),
+    ('openpyxl', '可选')
+)
+
+# 包名与导入名不同的依赖
+_DEPENDENCY_MODULES = {
+    'beautifulsoup4': 'bs4',
+    'Pillow': 'PIL'
+}
+
+# 内置字典模板，模块加载时编码一次，保存时整块写入
+_DICT_TEMPLATES = {
+    'usernames': (
+        "# 用户名字典\n"
+        "# 每行一个用户名\n\n"
+        "admin\n"
+        "administrator\n"
+        "root\n"
+        "test\n"
+        "user\n"
+        "guest\n"
+    ).encode('utf-8'),
+    'passwords': (
+        "# 密码字典\n"
+        "# 每行一个密码\n\n"
+        "123456\n"
+        "password\n"
+        "admin\n"
+        "12345678\n"
+        "qwerty\n"
+        "abc123\n"
+    ).encode('utf-8')
+}
 
 
 class WizardStep(Enum):
@@ -153,6 +194,32 @@ class SetupWizard:
         )
         check_btn.pack(pady=10)
         
+        # 检查结果表（检查时只更新状态列，不重建组件）
+        self.dep_tree = ttk.Treeview(
+            self.dep_results_frame,
+            columns=('level', 'status'),
+            show='tree headings',
+            height=len(_DEPENDENCIES)
+        )
+        self.dep_tree.heading('#0', text='依赖')
+        self.dep_tree.heading('level', text='级别')
+        self.dep_tree.heading('status', text='状态')
+        self.dep_tree.column('#0', width=200)
+        self.dep_tree.column('level', width=80, anchor=tk.CENTER)
+        self.dep_tree.column('status', width=120, anchor=tk.CENTER)
+        self.dep_tree.tag_configure('ok', foreground='green')
+        self.dep_tree.tag_configure('missing', foreground='red')
+        for dep, level in _DEPENDENCIES:
+            self.dep_tree.insert('', tk.END, iid=dep, text=dep, values=(level, '待检查'))
+        self.dep_tree.pack(padx=20)
+        
+        # 安装按钮（有缺失的必需依赖时显示）
+        self.dep_install_btn = ttk.Button(
+            self.dep_results_frame,
+            text="安装缺失的依赖",
+            command=self._install_dependencies
+        )
+        
         # 说明文本
         info_text = """
 工具需要以下依赖才能正常运行：
@@ -177,89 +244,126 @@ class SetupWizard:
     
     def _check_dependencies(self):
         """检查依赖"""
-        # 清空结果区域
-        for widget in self.dep_results_frame.winfo_children():
-            if widget.winfo_class() != 'TButton':
-                widget.destroy()
-        
-        dependencies = [
-            ('requests', '必需'),
-            ('beautifulsoup4', '必需'),
-            ('aiohttp', '推荐'),
-            ('Pillow', '可选'),
-            ('pytesseract', '可选'),
-            ('pandas', '可选'),
-            ('openpyxl', '可选')
-        ]
-        
         all_installed = True
         
-        for dep, level in dependencies:
-            try:
-                __import__(dep)
-                status = "✓ 已安装"
-                status_color = "green"
-            except ImportError:
-                status = "✗ 未安装"
-                status_color = "red"
+        # 只查找模块而不导入，避免加载pandas等大型依赖
+        importlib.invalidate_caches()
+        
+        for dep, level in _DEPENDENCIES:
+            if importlib.util.find_spec(_DEPENDENCY_MODULES.get(dep, dep)) is not None:
+                self.dep_tree.set(dep, 'status', "✓ 已安装")
+                self.dep_tree.item(dep, tags=('ok',))
+            else:
+                self.dep_tree.set(dep, 'status', "✗ 未安装")
+                self.dep_tree.item(dep, tags=('missing',))
                 if level == "必需":
                     all_installed = False
-            
-            # 创建结果行
-            row_frame = ttk.Frame(self.dep_results_frame)
-            row_frame.pack(fill=tk.X, pady=2, padx=20)
-            
-            name_label = ttk.Label(row_frame, text=f"{dep:20s}", width=20)
-            name_label.pack(side=tk.LEFT)
-            
-            level_label = ttk.Label(row_frame, text=f"{level:6s}", width=6)
-            level_label.pack(side=tk.LEFT, padx=10)
-            
-            status_label = ttk.Label(row_frame, text=status, foreground=status_color)
-            status_label.pack(side=tk.LEFT)
         
         # 安装按钮
-        if not all_installed:
-            install_btn = ttk.Button(
-                self.dep_results_frame,
-                text="安装缺失的依赖",
-                command=self._install_dependencies
-            )
-            install_btn.pack(pady=10)
+        if all_installed:
+            self.dep_install_btn.pack_forget()
+        else:
+            self.dep_install_btn.pack(pady=10)
         
         # 完成状态
         self.dep_check_complete = True
         self.dep_all_installed = all_installed
     
     def _install_dependencies(self):
-        """安装依赖"""
+        """安装依赖（pip在后台线程中运行，避免阻塞界面）"""
+        import queue
         import subprocess
         import sys
+        import threading
         
-        try:
-            # 显示安装信息
-            info_label = ttk.Label(
-                self.dep_results_frame,
-                text="正在安装依赖，请稍候...",
-                foreground="blue"
-            )
-            info_label.pack(pady=10)
-            
-            self.window.update()
+        if getattr(self, 'dep_installing', False):
+            return
+        self.dep_installing = True
+        
+        # 显示安装信息
+        info_label = ttk.Label(
+            self.dep_results_frame,
+            text="正在安装依赖，请稍候...",
+            foreground="blue"
+        )
+        info_label.pack(pady=10)
+        
+        progress_bar = ttk.Progressbar(self.dep_results_frame, mode='indeterminate', length=300)
+        progress_bar.pack(pady=5)
+        progress_bar.start(10)
+        
+        # 安装期间可能已切换到其他步骤，此时本页组件已被销毁
+        def show_output(line: str):
+            if info_label.winfo_exists():
+                info_label.configure(text=line[:80])
+        
+        def on_finished(error: Optional[str]):
+            self.dep_installing = False
+            if progress_bar.winfo_exists():
+                progress_bar.stop()
+                progress_bar.destroy()
+                info_label.destroy()
+                if error is None:
+                    # 重新检查
+                    self._check_dependencies()
             
-            # 安装核心依赖
-            subprocess.check_call([
-                sys.executable, "-m", "pip", "install",
-                "requests", "beautifulsoup4", "aiohttp"
-            ])
+            if error is None:
+                messagebox.showinfo("成功", "依赖安装完成！")
+            else:
+                messagebox.showerror("错误", f"安装失败: {error}")
+        
+        # 后台线程不能调用Tk，只把输出和结果放入队列，由主线程定时取出
+        events: queue.Queue = queue.Queue()
+        
+        def worker():
+            error = None
+            try:
+                # 安装核心依赖，逐行显示pip输出
+                process = subprocess.Popen(
+                    [sys.executable, "-m", "pip", "install",
+                     "requests", "beautifulsoup4", "aiohttp"],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True
+                )
+                for line in process.stdout:
+                    line = line.strip()
+                    if line:
+                        events.put(('output', line))
+                returncode = process.wait()
+                if returncode != 0:
+                    error = f"pip 返回码 {returncode}"
+            except Exception as e:
+                error = str(e)
             
-            # 重新检查
-            self._check_dependencies()
+            events.put(('finished', error))
+        
+        def poll():
+            # 向导窗口已关闭时停止轮询，pip仍在后台线程中运行完毕
+            try:
+                if not self.window.winfo_exists():
+                    return
+            except tk.TclError:
+                return
             
-            messagebox.showinfo("成功", "依赖安装完成！")
+            last_line = None
+            while True:
+                try:
+                    kind, value = events.get_nowait()
+                except queue.Empty:
+                    break
+                if kind == 'output':
+                    last_line = value
+                else:
+                    on_finished(value)
+                    return
             
-        except Exception as e:
-            messagebox.showerror("错误", f"安装失败: {e}")
+            if last_line is not None:
+                show_output(last_line)
+            self.window.after(100, poll)
+        
+        threading.Thread(target=worker, daemon=True).start()
+        self.window.after(100, poll)
     
     def _show_template_download(self):
         """显示模板下载页面"""
@@ -341,6 +445,9 @@ class SetupWizard:
     
     def _download_template(self, format: str):
         """下载模板"""
+        # 延迟导入：导入器会加载pandas/openpyxl，只在实际下载模板时才需要
+        from .enhanced_batch_importer import EnhancedBatchImporter, ImportFormat
+        
         importer = EnhancedBatchImporter()
         
         # 选择保存位置
@@ -372,30 +479,6 @@ class SetupWizard:
     
     def _download_dict(self, dict_type: str):
         """下载字典"""
-        # 字典内容
-        dictionaries = {
-            'usernames': [
-                "# 用户名字典\n",
-                "# 每行一个用户名\n\n",
-                "admin\n",
-                "administrator\n",
-                "root\n",
-                "test\n",
-                "user\n",
-                "guest\n"
-            ],
-            'passwords': [
-                "# 密码字典\n",
-                "# 每行一个密码\n\n",
-                "123456\n",
-                "password\n",
-                "admin\n",
-                "12345678\n",
-                "qwerty\n",
-                "abc123\n"
-            ]
-        }
-        
         # 选择保存位置
         filetypes = {
             'usernames': [("文本文件", "*.txt")],
@@ -409,14 +492,14 @@ class SetupWizard:
         
         filepath = filedialog.asksaveasfilename(
             title="保存字典文件",
-            defaultfilename=default_name.get(dict_type, 'dict.txt'),
+            initialfile=default_name.get(dict_type, 'dict.txt'),
             filetypes=filetypes.get(dict_type, [("所有文件", "*.*")])
         )
         
         if filepath:
             try:
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.writelines(dictionaries.get(dict_type, []))
+                with open(filepath, 'wb') as f:
+                    f.write(_DICT_TEMPLATES[dict_type])
                 
                 messagebox.showinfo("成功", f"字典已保存到:\n{filepath}")
             except Exception as e:
@@ -8,6 +8,7 @@
 import sys
 import os
 import argparse
+import importlib.util
 import io
 from pathlib import Path
 from datetime import datetime
@@ -28,6 +29,13 @@ if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
 
+# 自动并发数上限；目标分布在多个主机时并发是吞吐量的主要来源
+MAX_AUTO_CONCURRENCY = 64
+
+# 单个主机的最大并发连接数，避免同一目标因整体并发调高而承受更大压力
+PER_HOST_CONCURRENCY = 5
+
+
 def print_banner():
     """打印横幅"""
     print()
@@ -39,16 +47,13 @@ def print_banner():
 
 def check_dependencies():
     """检查依赖"""
+    # 只查找模块而不导入，避免启动时加载requests及其依赖
     missing = []
     
-    try:
-        import requests
-    except ImportError:
+    if importlib.util.find_spec('requests') is None:
         missing.append('requests')
     
-    try:
-        from bs4 import BeautifulSoup
-    except ImportError:
+    if importlib.util.find_spec('bs4') is None:
         missing.append('beautifulsoup4')
     
     if missing:
@@ -65,10 +70,11 @@ def check_dependencies():
 def find_csv_files():
     """查找当前目录下的CSV文件"""
     csv_files = []
-    for f in Path(current_dir).glob("*.csv"):
-        # 排除结果文件
-        if "_results_" not in f.name:
-            csv_files.append(f)
+    with os.scandir(current_dir) as entries:
+        for entry in entries:
+            # 排除结果文件
+            if entry.name.endswith(".csv") and "_results_" not in entry.name and entry.is_file():
+                csv_files.append(Path(entry.path))
     return csv_files
 
 
@@ -80,7 +86,13 @@ def get_sample_csv():
     return None
 
 
-def run_batch_verify(csv_path: str, output_dir: str = None, verbose: bool = False):
+def run_batch_verify(
+    csv_path: str,
+    output_dir: str = None,
+    verbose: bool = False,
+    concurrency: int = 0,
+    delay: float = 0.3
+):
     """
     运行批量验证（使用新的统一验证器）
 
@@ -88,6 +100,8 @@ def run_batch_verify(csv_path: str, output_dir: str = None, verbose: bool = Fals
         csv_path: CSV文件路径
         output_dir: 结果输出目录
         verbose: 是否显示详细信息
+        concurrency: 最大并发数，0表示按目标数自动确定（最多MAX_AUTO_CONCURRENCY）
+        delay: 同一主机的请求间隔（秒），每个主机每delay秒最多发出PER_HOST_CONCURRENCY个请求
     """
     try:
         from core import UnifiedVerifier, VerifyMode, TargetInfo, LoginStatus
@@ -119,95 +133,100 @@ def run_batch_verify(csv_path: str, output_dir: str = None, verbose: bool = Fals
         print("[!] 没有可验证的目标")
         return False
 
+    # 结果文件（边验证边写入，中途中断也能保留已完成的结果）
+    csv_name = Path(csv_path).stem
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    output_file = Path(output_dir or current_dir) / f"{csv_name}_results_{timestamp}.csv"
+
+    try:
+        f = open(output_file, 'w', newline='', encoding='utf-8-sig')
+    except Exception as e:
+        print(f"[!] 创建结果文件失败: {e}")
+        return False
+
+    total = len(result.targets)
+    max_concurrent = concurrency if concurrency > 0 else min(total, MAX_AUTO_CONCURRENCY)
+
     # 开始验证
     print()
-    print(f"[*] 开始异步验证 {len(result.targets)} 个目标...")
+    print(f"[*] 开始异步验证 {total} 个目标（并发数 {max_concurrent}）...")
     print("-" * 60)
 
-    # 异步批量验证
+    successes = []
+    success_count = 0
+    fail_count = 0
+
+    # 异步批量验证，按完成顺序逐条输出并写入结果文件
     async def run_async_verify():
+        nonlocal success_count, fail_count
         from core.simple_config import get_simple_config_manager
         config_manager = get_simple_config_manager()
 
+        writer = csv.writer(f)
+        writer.writerow(('url', 'username', 'password', 'success', 'status', 'message', 'response_time'))
+
         async with UnifiedVerifier(
             config_manager,
             mode=VerifyMode.ASYNC,
-            max_concurrent=5
+            max_concurrent=max_concurrent,
+            per_host_concurrent=min(PER_HOST_CONCURRENCY, max_concurrent)
         ) as verifier:
-            return await verifier.verify_batch(result.targets, delay=0.3)
-
-    # 运行异步验证
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
+            done = 0
+            async for index, login_result in verifier.verify_batch_iter(result.targets, delay=delay):
+                done += 1
+                target = result.targets[index]
+
+                print(f"\n[{done}/{total}] {login_result.url}")
+                print(f"    用户: {target.username}")
+
+                if login_result.success:
+                    print(f"    结果: [OK] 成功 - {login_result.message}")
+                    success_count += 1
+                    successes.append((login_result.url, target.username, target.password))
+                else:
+                    print(f"    结果: [FAIL] 失败 - {login_result.message}")
+                    fail_count += 1
+
+                print(f"    耗时: {login_result.response_time:.2f}秒")
+
+                writer.writerow((
+                    login_result.url,
+                    target.username,
+                    target.password,
+                    login_result.success,
+                    login_result.status.value if login_result.status else 'unknown',
+                    login_result.message,
+                    f"{login_result.response_time:.2f}"
+                ))
+                if done % 100 == 0:
+                    f.flush()
+
+    # 运行异步验证（asyncio.run负责取消残留任务、关闭异步生成器和事件循环）
     try:
-        login_results = loop.run_until_complete(run_async_verify())
+        asyncio.run(run_async_verify())
     finally:
-        loop.close()
-
-    # 处理结果
-    results = []
-    success_count = 0
-    fail_count = 0
-
-    for i, login_result in enumerate(login_results, 1):
-        print(f"\n[{i}/{len(result.targets)}] {login_result.url}")
-        print(f"    用户: {result.targets[i-1].username}")
-
-        if login_result.success:
-            print(f"    结果: [OK] 成功 - {login_result.message}")
-            success_count += 1
-        else:
-            print(f"    结果: [FAIL] 失败 - {login_result.message}")
-            fail_count += 1
-
-        print(f"    耗时: {login_result.response_time:.2f}秒")
-
-        results.append({
-            'url': login_result.url,
-            'username': result.targets[i-1].username,
-            'password': result.targets[i-1].password,
-            'success': login_result.success,
-            'status': login_result.status.value if login_result.status else 'unknown',
-            'message': login_result.message,
-            'response_time': f"{login_result.response_time:.2f}"
-        })
+        f.close()
 
     # 汇总结果
     print()
     print("=" * 60)
     print("  验证结果汇总")
     print("=" * 60)
-    print(f"  总计: {len(result.targets)}")
+    print(f"  总计: {total}")
     print(f"  成功: {success_count}")
     print(f"  失败: {fail_count}")
-    print(f"  成功率: {success_count/len(result.targets)*100:.1f}%")
+    print(f"  成功率: {success_count/total*100:.1f}%")
     print()
-
-    # 保存结果
-    csv_name = Path(csv_path).stem
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    output_file = Path(output_dir or current_dir) / f"{csv_name}_results_{timestamp}.csv"
-
-    try:
-        with open(output_file, 'w', newline='', encoding='utf-8-sig') as f:
-            writer = csv.DictWriter(f, fieldnames=[
-                'url', 'username', 'password', 'success', 'status', 'message', 'response_time'
-            ])
-            writer.writeheader()
-            writer.writerows(results)
-        print(f"[+] 结果已保存到: {output_file}")
-    except Exception as e:
-        print(f"[!] 保存结果失败: {e}")
+    print(f"[+] 结果已保存到: {output_file}")
 
     # 显示成功的目标
     if success_count > 0:
         print()
         print("成功的目标:")
         print("-" * 60)
-        for r in results:
-            if r['success']:
-                print(f"  {r['url']}")
-                print(f"    账号: {r['username']} / {r['password']}")
+        for url, username, password in successes:
+            print(f"  {url}")
+            print(f"    账号: {username} / {password}")
 
     return True
 
@@ -340,6 +359,7 @@ def main():
   python launcher.py              交互式菜单
   python launcher.py --gui        启动图形界面
   python launcher.py --batch 目标.csv  批量验证
+  python launcher.py --batch 目标.csv -c 32  指定并发数批量验证
   python launcher.py --sample     验证示例目标.csv
 
 新功能:
@@ -355,6 +375,10 @@ def main():
     parser.add_argument('--sample', action='store_true', help='验证示例目标.csv')
     parser.add_argument('-o', '--output', metavar='DIR', help='结果输出目录')
     parser.add_argument('-v', '--verbose', action='store_true', help='显示详细信息')
+    parser.add_argument('-c', '--concurrency', type=int, default=0, metavar='N',
+                        help=f'最大并发数（默认按目标数自动确定，最多{MAX_AUTO_CONCURRENCY}）')
+    parser.add_argument('--delay', type=float, default=0.3, metavar='SECONDS',
+                        help=f'同一主机的请求间隔（秒，默认0.3）：每个主机每隔该时间最多发出{PER_HOST_CONCURRENCY}个请求')
 
     args = parser.parse_args()
 
@@ -374,12 +398,12 @@ def main():
         if not os.path.exists(args.batch):
             print(f"[!] 文件不存在: {args.batch}")
             return
-        run_batch_verify(args.batch, args.output, args.verbose)
+        run_batch_verify(args.batch, args.output, args.verbose, args.concurrency, args.delay)
 
     elif args.sample:
         sample_csv = get_sample_csv()
         if sample_csv:
-            run_batch_verify(str(sample_csv), args.output, args.verbose)
+            run_batch_verify(str(sample_csv), args.output, args.verbose, args.concurrency, args.delay)
         else:
             print("[!] 未找到 示例目标.csv 文件")
 
@@ -67,6 +67,13 @@ setup(
             'openpyxl>=3.0.0',
             'xlrd>=2.0.0',
         ],
+        'speed': [
+            'orjson>=3.9.0',
+            'pyahocorasick>=2.0.0',
+            'xxhash>=3.0.0',
+            'selectolax>=0.3.17',
+            'numpy>=1.21.0',
+        ],
     },
     entry_points={
         'console_scripts': [